@@ -1,18 +1,75 @@
 from flask import Flask, render_template, jsonify, request
 from google.cloud import bigquery
+from google.api_core.exceptions import NotFound
 import os
 import json
-from datetime import datetime
+import io
+import re
+from datetime import datetime, date as date_type
+from decimal import Decimal
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
+from email.message import EmailMessage
 import weasyprint
-from jinja2 import Template
+from weasyprint.text.fonts import FontConfiguration
+from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, Future
+import multiprocessing
+import signal
+import gc
+import math
+import logging
+import logging.handlers
+import queue
+import atexit
+from collections import OrderedDict
+import hashlib
+import functools
+import threading
+import time
+from requests.adapters import HTTPAdapter
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None  # Query results are then decoded row by row over the REST API
+
+try:
+    from google.cloud import bigquery_storage
+except ImportError:
+    bigquery_storage = None  # Query results are then downloaded over the REST API
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # Numeric kernels below fall back to plain NumPy
 
 app = Flask(__name__)
 
+# Log records are queued and written by a background thread, so request and render paths never
+# block on stdout/stderr. Set LOG_LEVEL=DEBUG to see the per-point diagnostics
+LOG_FORMAT = '%(asctime)s %(levelname)s [%(process)d] %(message)s'
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+logger.propagate = False
+
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(log_queue))
+log_listener = logging.handlers.QueueListener(log_queue, log_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+def configure_worker_logging():
+    """Pool initializer: forked workers don't inherit the listener thread, so log directly"""
+    logger.handlers = [log_handler]
+
 # Load email configuration from file
 def load_email_config():
     try:
@@ -20,10 +77,10 @@ def load_email_config():
             config = json.load(f)
         return config
     except FileNotFoundError:
-        print("email_config.json not found. Please create it with your email credentials.")
+        logger.warning("email_config.json not found. Please create it with your email credentials.")
         return None
     except json.JSONDecodeError:
-        print("Error parsing email_config.json. Please check the JSON format.")
+        logger.error("Error parsing email_config.json. Please check the JSON format.")
         return None
 
 # Load email config
@@ -44,17 +101,143 @@ else:
     EMAIL_PASSWORD = ''
     EMAIL_FROM = ''
 
+# Checked once at startup rather than on every send
+EMAIL_CONFIGURED = bool(EMAIL_USERNAME and EMAIL_PASSWORD)
+if not EMAIL_CONFIGURED:
+    logger.warning("Email configuration not available. Please check email_config.json")
+
+# Base URL so WeasyPrint can find static files; these are constant for the life of the process
+BASE_URL = f"file://{os.path.abspath('.')}/"
+STATIC_DIR = os.path.join(os.getcwd(), 'static')
+if not os.path.exists(STATIC_DIR):
+    logger.warning("Static directory not found at %s", STATIC_DIR)
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    logger.info("Created static directory at %s", STATIC_DIR)
+
 # Set up Google Cloud credentials
 os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = 'harvard-baseball-13fab221b2d4.json'
 
+# Safety cap on bytes billed for the per-hitter report queries (10 GB)
+MAX_BYTES_BILLED = 10 * 1024 ** 3
+
+# Settings shared by every report data fetch; report_job_config() copies it and adds the parameters
+REPORT_JOB_CONFIG = bigquery.QueryJobConfig(maximum_bytes_billed=MAX_BYTES_BILLED, use_query_cache=True)
+
+def report_job_config(query_parameters):
+    """A copy of REPORT_JOB_CONFIG with the given query parameters"""
+    job_config = bigquery.QueryJobConfig.from_api_repr(REPORT_JOB_CONFIG.to_api_repr())
+    job_config.query_parameters = query_parameters
+    return job_config
+
 # Initialize BigQuery client
 try:
     client = bigquery.Client()
-    print("BigQuery client initialized successfully")
+    logger.info("BigQuery client initialized successfully")
 except Exception as e:
-    print(f"Error initializing BigQuery client: {e}")
+    logger.error("Error initializing BigQuery client: %s", e)
     client = None
 
+# Widen the client's HTTPS connection pool so concurrent queries reuse warm keep-alive
+# connections instead of paying a TLS handshake each (requests defaults to 10 per host)
+if client:
+    try:
+        client._http.mount('https://', HTTPAdapter(
+            pool_connections=32, pool_maxsize=32, max_retries=3
+        ))
+    except Exception as e:
+        logger.warning("Could not configure BigQuery connection pool: %s", e)
+
+# BigQuery Storage API client, used to download large results as Arrow instead of paged JSON
+bqstorage_client = None
+if client and bigquery_storage and pyarrow:
+    try:
+        bqstorage_client = bigquery_storage.BigQueryReadClient()
+    except Exception as e:
+        logger.warning("BigQuery Storage client not available, using the REST API for results: %s", e)
+
+# Shared pool for overlapping independent BigQuery round trips; the client releases the GIL on I/O
+query_executor = ThreadPoolExecutor(max_workers=8)
+
+def query_to_records(query, job_config=None, max_results=None, start_index=None):
+    """Run a query and return its rows as a list of dicts, decoded from Arrow when pyarrow is installed
+    
+    query_and_wait lets the client use the jobs.query fast path, so small results come back in one call.
+    Passing max_results/start_index reads just that page of the result.
+    """
+    if max_results is None and not start_index:
+        result = client.query_and_wait(query, job_config=job_config)
+    else:
+        result = client.query(query, job_config=job_config).result(
+            max_results=max_results, start_index=start_index
+        )
+    if pyarrow is None:
+        return [dict(row) for row in result]
+    table = result.to_arrow(bqstorage_client=bqstorage_client, create_bqstorage_client=False)
+    return table.to_pylist()
+
+# Upper bound on ?limit= for the paginated row endpoints
+MAX_PAGE_SIZE = 5000
+
+def get_page_params():
+    """Read the optional ?limit=&offset= paging parameters; limit is None when not paging"""
+    limit = request.args.get('limit', type=int)
+    offset = request.args.get('offset', default=0, type=int) or 0
+    if limit is not None:
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+    return limit, max(0, offset)
+
+def page_info(rows, limit, offset):
+    """Paging fields to add to a response; next_offset is None on the last page"""
+    if limit is None:
+        return {}
+    return {
+        'limit': limit,
+        'offset': offset,
+        'next_offset': offset + len(rows) if len(rows) == limit else None
+    }
+
+# Short-lived results for the lookup endpoints, plus the queries currently running for them
+LOOKUP_CACHE = OrderedDict()
+LOOKUP_CACHE_TTL = 60  # seconds; dates and rosters change slowly
+LOOKUP_CACHE_MAX_ENTRIES = 2048
+INFLIGHT_LOOKUPS = {}
+LOOKUP_LOCK = threading.Lock()
+
+def shared_lookup(key, fetch, ttl=LOOKUP_CACHE_TTL):
+    """Return fetch() for key, reusing a recent result or waiting on an identical in-flight query"""
+    with LOOKUP_LOCK:
+        cached = LOOKUP_CACHE.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        future = INFLIGHT_LOOKUPS.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            INFLIGHT_LOOKUPS[key] = future
+    
+    if not is_owner:
+        return future.result()
+    
+    try:
+        value = fetch()
+    except Exception as e:
+        # Errors are handed to the waiters but never cached
+        with LOOKUP_LOCK:
+            INFLIGHT_LOOKUPS.pop(key, None)
+        future.set_exception(e)
+        raise
+    
+    with LOOKUP_LOCK:
+        INFLIGHT_LOOKUPS.pop(key, None)
+        # None means "nothing found yet"; it's shared with the waiters but asked again next time
+        if value is not None:
+            LOOKUP_CACHE[key] = (time.monotonic() + ttl, value)
+            LOOKUP_CACHE.move_to_end(key)
+            while len(LOOKUP_CACHE) > LOOKUP_CACHE_MAX_ENTRIES:
+                LOOKUP_CACHE.popitem(last=False)
+    future.set_result(value)
+    return value
+
 @app.route('/')
 def index():
     """Serve the main HTML page"""
@@ -65,37 +248,80 @@ def point_of_contact_page(hitter_name, date):
     """Serve the Point of Contact analysis page"""
     return render_template('point_of_contact.html', hitter_name=hitter_name, date=date)
 
-@app.route('/api/dates')
-def get_dates():
-    """API endpoint to get all available dates from TestTwo"""
-    if not client:
-        return jsonify({'error': 'BigQuery client not initialized'}), 500
-    
+# Precomputed per-date rollup so /api/dates reads a few rows instead of scanning TestTwo.
+# BigQuery keeps it up to date incrementally; create it once with:
+#   CREATE MATERIALIZED VIEW `V1PBR.DatesMV` AS
+#   SELECT Date, COUNT(*) AS n FROM `V1PBR.TestTwo` WHERE Date IS NOT NULL GROUP BY Date
+DATES_VIEW = 'V1PBR.DatesMV'
+DATES_CACHE_TTL = 300  # seconds
+
+def fetch_dates():
+    """Query all available dates as strings, from the dates view when it exists"""
+    query = f"""
+    SELECT Date
+    FROM `{DATES_VIEW}`
+    ORDER BY Date
+    """
+    
+    # Small result: query_and_wait takes the single-call jobs.query (short query) path
+    job_config = bigquery.QueryJobConfig(use_query_cache=True)
     try:
+        result = client.query_and_wait(query, job_config=job_config)
+    except NotFound:
+        logger.warning("%s not found, scanning TestTwo for dates", DATES_VIEW)
         query = """
         SELECT DISTINCT Date
         FROM `V1PBR.TestTwo`
         WHERE Date IS NOT NULL
         ORDER BY Date
         """
-        
-        result = client.query(query)
-        dates = []
-        for row in result:
-            # Convert date to string format that matches what's stored
-            date_val = row.Date
-            if hasattr(date_val, 'strftime'):
-                # If it's a datetime object, format it
-                dates.append(date_val.strftime('%Y-%m-%d'))
-            else:
-                # If it's already a string, use as-is
-                dates.append(str(date_val))
-        
+        result = client.query_and_wait(query, job_config=job_config)
+    
+    dates = []
+    for row in result:
+        # Convert date to string format that matches what's stored
+        date_val = row.Date
+        if hasattr(date_val, 'strftime'):
+            # If it's a datetime object, format it
+            dates.append(date_val.strftime('%Y-%m-%d'))
+        else:
+            # If it's already a string, use as-is
+            dates.append(str(date_val))
+    return dates
+
+@app.route('/api/dates')
+def get_dates():
+    """API endpoint to get all available dates from TestTwo"""
+    if not client:
+        return jsonify({'error': 'BigQuery client not initialized'}), 500
+    
+    try:
+        dates = shared_lookup(('dates',), fetch_dates, ttl=DATES_CACHE_TTL)
         return jsonify({'dates': dates})
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def fetch_hitters(selected_date):
+    """Query the unique hitters for a specific date"""
+    query = """
+    SELECT DISTINCT Batter
+    FROM `V1PBR.TestTwo`
+    WHERE CAST(Date AS STRING) = @date
+    AND Batter IS NOT NULL
+    ORDER BY Batter
+    """
+    
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("date", "STRING", selected_date),
+        ],
+        use_query_cache=True
+    )
+    
+    result = client.query_and_wait(query, job_config=job_config)
+    return [row.Batter for row in result]
+
 @app.route('/api/hitters')
 def get_hitters():
     """API endpoint to get unique hitters for a specific date"""
@@ -107,23 +333,7 @@ def get_hitters():
         return jsonify({'error': 'Date parameter is required'}), 400
     
     try:
-        query = """
-        SELECT DISTINCT Batter
-        FROM `V1PBR.TestTwo`
-        WHERE CAST(Date AS STRING) = @date
-        AND Batter IS NOT NULL
-        ORDER BY Batter
-        """
-        
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("date", "STRING", selected_date),
-            ]
-        )
-        
-        result = client.query(query, job_config=job_config)
-        hitters = [row.Batter for row in result]
-        
+        hitters = shared_lookup(('hitters', selected_date), lambda: fetch_hitters(selected_date))
         return jsonify({'hitters': hitters})
     
     except Exception as e:
@@ -143,7 +353,18 @@ def get_hitter_details():
     
     try:
         query = """
-        SELECT *
+        SELECT 
+            PitchNo,
+            ExitSpeed,
+            Angle,
+            Distance,
+            Direction,
+            ContactPositionX,
+            ContactPositionY,
+            ContactPositionZ,
+            PlayResult,
+            Date,
+            Batter
         FROM `V1PBR.TestTwo`
         WHERE CAST(Date AS STRING) = @date
         AND Batter = @hitter
@@ -157,14 +378,11 @@ def get_hitter_details():
             ]
         )
         
-        result = client.query(query, job_config=job_config)
+        # Convert to list of dictionaries, one page at a time when ?limit= is given
+        limit, offset = get_page_params()
+        hitting_data = query_to_records(query, job_config=job_config, max_results=limit, start_index=offset)
         
-        # Convert to list of dictionaries
-        hitting_data = []
-        for row in result:
-            hitting_data.append(dict(row))
-        
-        return jsonify({'hitting_data': hitting_data})
+        return jsonify({'hitting_data': hitting_data, **page_info(hitting_data, limit, offset)})
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -209,41 +427,81 @@ def get_point_of_contact():
             ]
         )
         
-        result = client.query(query, job_config=job_config)
-        
-        # Convert to list of dictionaries
-        contact_data = []
-        for row in result:
-            contact_data.append(dict(row))
+        # Convert to list of dictionaries, one page at a time when ?limit= is given
+        limit, offset = get_page_params()
+        contact_data = query_to_records(query, job_config=job_config, max_results=limit, start_index=offset)
         
-        # Calculate contact statistics
-        contact_stats = calculate_contact_stats(contact_data)
+        # Calculate contact statistics (for the returned rows)
+        contact_stats = calculate_contact_stats(build_contact_arrays(contact_data))
         
         return jsonify({
             'contact_data': contact_data,
-            'contact_stats': contact_stats
+            'contact_stats': contact_stats,
+            **page_info(contact_data, limit, offset)
         })
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-def calculate_contact_stats(contact_data):
-    """Calculate point of contact statistics"""
-    if not contact_data:
+def build_contact_arrays(hitting_data):
+    """Pack records with a full contact position into parallel arrays in a single pass"""
+    pitch_nos = []
+    positions = []
+    exit_speeds = []
+    angles = []
+    distances = []
+    directions = []
+    play_results = []
+    
+    for hit in hitting_data or []:
+        x_pos = hit.get('ContactPositionX')
+        if x_pos is None or x_pos == '':
+            continue
+        y_pos = hit.get('ContactPositionY')
+        if y_pos is None or y_pos == '':
+            continue
+        z_pos = hit.get('ContactPositionZ')
+        if z_pos is None or z_pos == '':
+            continue
+        
+        pitch_nos.append(hit.get('PitchNo'))
+        positions.append((float(x_pos), float(y_pos), float(z_pos)))
+        exit_speeds.append(hit.get('ExitSpeed'))
+        angles.append(hit.get('Angle'))
+        distances.append(hit.get('Distance'))
+        directions.append(hit.get('Direction'))
+        play_results.append(hit.get('PlayResult'))
+    
+    if not positions:
         return None
     
-    # Extract coordinates
-    x_positions = [d['ContactPositionX'] for d in contact_data if d['ContactPositionX'] is not None]
-    y_positions = [d['ContactPositionY'] for d in contact_data if d['ContactPositionY'] is not None]
-    z_positions = [d['ContactPositionZ'] for d in contact_data if d['ContactPositionZ'] is not None]
+    # One (n, 3) block of X/Y/Z; the per-axis entries are column views into it
+    positions = np.array(positions)
     
-    if not x_positions:
+    # Missing ExitSpeed / Angle become NaN so comparisons on them are simply False
+    return {
+        'PitchNo': pitch_nos,
+        'ContactPositions': positions,
+        'ContactPositionX': positions[:, 0],
+        'ContactPositionY': positions[:, 1],
+        'ContactPositionZ': positions[:, 2],
+        'ExitSpeed': np.array(exit_speeds, dtype=float),
+        'Angle': np.array(angles, dtype=float),
+        'Distance': distances,
+        'Direction': directions,
+        'PlayResult': play_results
+    }
+
+def calculate_contact_stats(contact_data):
+    """Calculate point of contact statistics from the arrays built by build_contact_arrays"""
+    if not contact_data:
         return None
     
-    # Calculate averages
-    avg_x = round(sum(x_positions) / len(x_positions), 2)
-    avg_y = round(sum(y_positions) / len(y_positions), 2)
-    avg_z = round(sum(z_positions) / len(z_positions), 2)
+    positions = contact_data['ContactPositions']
+    y_positions = contact_data['ContactPositionY']
+    
+    # Calculate averages for all three axes in one reduction
+    avg_x, avg_y, avg_z = (round(float(v), 2) for v in positions.mean(axis=0))
     
     # Determine primary contact zone based on Y position
     if avg_y > 3:
@@ -253,24 +511,23 @@ def calculate_contact_stats(contact_data):
     else:
         primary_zone = "Early"
     
-    # Calculate consistency (standard deviation)
-    import statistics
-    try:
-        consistency_score = round(statistics.stdev(y_positions), 2)
+    # Calculate consistency (sample standard deviation, needs at least two contacts)
+    if len(y_positions) > 1:
+        consistency_score = round(float(np.std(y_positions, ddof=1)), 2)
         if consistency_score < 2:
             consistency = "Excellent"
         elif consistency_score < 4:
             consistency = "Good"
         else:
             consistency = "Needs Work"
-    except:
+    else:
         consistency = "N/A"
     
     return {
         'avg_side': f"{avg_x:.1f}\"",
         'avg_depth': f"{avg_y:.1f}\"",
         'avg_height': f"{avg_z:.1f}\"",
-        'total_contacts': len(contact_data),
+        'total_contacts': len(positions),
         'primary_zone': primary_zone,
         'consistency': consistency,
         'raw_avg_x': avg_x,
@@ -304,9 +561,6 @@ def get_matched_hitters():
             ]
         )
         
-        hitters_result = client.query(hitters_query, job_config=job_config)
-        hitters_from_test = [row.Batter for row in hitters_result]
-        
         # Get hitter info from Info table (only Type = 'Hitting')
         hitters_info_query = """
         SELECT Event, Prospect, Email, Type, Comp
@@ -316,7 +570,12 @@ def get_matched_hitters():
         ORDER BY Prospect
         """
         
-        hitters_info_result = client.query(hitters_info_query)
+        # Both queries are independent, so run them concurrently
+        hitters_future = query_executor.submit(lambda: list(client.query(hitters_query, job_config=job_config)))
+        hitters_info_future = query_executor.submit(lambda: list(client.query(hitters_info_query)))
+        
+        hitters_from_test = [row.Batter for row in hitters_future.result()]
+        hitters_info_result = hitters_info_future.result()
         matched_hitters = []
         
         for row in hitters_info_result:
@@ -343,8 +602,6 @@ def get_stats():
     try:
         # Get total record count from TestTwo
         count_query = "SELECT COUNT(*) as total FROM `V1PBR.TestTwo`"
-        count_result = client.query(count_query)
-        total_records = list(count_result)[0].total
         
         # Get date range from TestTwo
         date_range_query = """
@@ -357,57 +614,55 @@ def get_stats():
         WHERE Date IS NOT NULL
         """
         
-        date_result = client.query(date_range_query)
-        date_info = list(date_result)[0]
-        
-        # Get all hitters from TestTwo table
-        test_hitters_query = """
-        SELECT DISTINCT Batter
-        FROM `V1PBR.TestTwo`
-        WHERE Batter IS NOT NULL
-        ORDER BY Batter
+        # TestTwo batters joined against Info hitting prospects; one row per Info prospect row
+        # (with Batter set when it matched) plus one row per TestTwo batter missing from Info
+        roster_query = """
+        WITH t AS (
+            SELECT DISTINCT Batter
+            FROM `V1PBR.TestTwo`
+            WHERE Batter IS NOT NULL
+        ),
+        i AS (
+            SELECT Prospect, Email, TRUE AS in_info
+            FROM `V1PBRInfo.Info`
+            WHERE Type = 'Hitting'
+        )
+        SELECT t.Batter, i.Prospect, i.Email, i.in_info
+        FROM t
+        FULL OUTER JOIN i
+        ON t.Batter = i.Prospect
         """
         
-        test_result = client.query(test_hitters_query)
-        test_hitters = set([row.Batter for row in test_result])
+        # The queries are independent, so run them concurrently
+        count_future = query_executor.submit(lambda: list(client.query(count_query)))
+        date_future = query_executor.submit(lambda: list(client.query(date_range_query)))
+        roster_future = query_executor.submit(lambda: list(client.query(roster_query)))
         
-        # Get hitting prospects from Info table (Type = 'Hitting')
-        info_hitters_query = """
-        SELECT Event, Prospect, Email, Type
-        FROM `V1PBRInfo.Info`
-        WHERE Type = 'Hitting'
-        ORDER BY Prospect
-        """
+        total_records = count_future.result()[0].total
+        date_info = date_future.result()[0]
         
-        info_result = client.query(info_hitters_query)
-        info_hitters = []
+        # Bucket names in a single pass over the joined rows
+        test_hitters = set()
         info_hitter_names = set()
+        matched_names = set()
+        matched_with_email = 0
+        matched_without_email = 0
         
-        for row in info_result:
-            info_hitters.append({
-                'name': row.Prospect,
-                'email': row.Email,
-                'type': row.Type,
-                'event': row.Event
-            })
-            info_hitter_names.add(row.Prospect)
+        for row in roster_future.result():
+            if row.Batter is not None:
+                test_hitters.add(row.Batter)
+            if row.in_info:
+                info_hitter_names.add(row.Prospect)
+                if row.Batter is not None:
+                    matched_names.add(row.Prospect)
+                    if row.Email:
+                        matched_with_email += 1
+                    else:
+                        matched_without_email += 1
         
-        # Find matches and mismatches
-        matched_names = test_hitters.intersection(info_hitter_names)
         test_only = test_hitters - info_hitter_names  # In TestTwo but not in Info
         info_only = info_hitter_names - test_hitters  # In Info but not in TestTwo
         
-        # Get email info for matched hitters
-        matched_with_email = 0
-        matched_without_email = 0
-        
-        for hitter in info_hitters:
-            if hitter['name'] in matched_names:
-                if hitter['email']:
-                    matched_with_email += 1
-                else:
-                    matched_without_email += 1
-        
         return jsonify({
             'total_records': total_records,
             'earliest_date': date_info.earliest_date,
@@ -434,119 +689,139 @@ def get_stats():
 def get_hitter_competition_level(hitter_name):
     """Get the competition level for a specific hitter from the Info table"""
     try:
-        query = """
-        SELECT Comp
-        FROM `V1PBRInfo.Info`
-        WHERE Prospect = @hitter_name
-        AND Type = 'Hitting'
-        LIMIT 1
-        """
-        
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("hitter_name", "STRING", hitter_name),
-            ]
+        # A prospect not in Info yet is looked up again next time instead of staying D1
+        level = shared_lookup(
+            ('competition_level', hitter_name),
+            lambda: fetch_hitter_competition_level(hitter_name),
+            ttl=COMPETITION_LEVEL_CACHE_TTL
         )
-        
-        result = client.query(query, job_config=job_config)
-        row = list(result)
-        
-        if row and row[0].Comp:
-            return row[0].Comp
-        else:
-            return 'D1'  # Default to D1 if no competition level found
+        return level or 'D1'  # Default to D1 if no competition level found
             
     except Exception as e:
-        print(f"Error getting competition level for {hitter_name}: {str(e)}")
+        logger.error("Error getting competition level for %s: %s", hitter_name, e)
         return 'D1'  # Default to D1 on error
 
+COMPETITION_LEVEL_CACHE_TTL = 600  # seconds
+
+def fetch_hitter_competition_level(hitter_name):
+    """Query a hitter's competition level (errors propagate; None when Info has no level for them)"""
+    query = """
+    SELECT Comp
+    FROM `V1PBRInfo.Info`
+    WHERE Prospect = @hitter_name
+    AND Type = 'Hitting'
+    LIMIT 1
+    """
+    
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("hitter_name", "STRING", hitter_name),
+        ]
+    )
+    
+    result = client.query_and_wait(query, job_config=job_config)
+    row = list(result)
+    
+    if row and row[0].Comp:
+        return row[0].Comp
+    return None
+
 
 def get_college_hitting_averages(comparison_level='D1'):
     """Get college baseball hitting averages for comparison - FIXED version without Cartesian product"""
     try:
-        # Determine the WHERE clause based on comparison level
-        if comparison_level == 'SEC':
-            level_filter = "League = 'SEC'"
-        elif comparison_level in ['D1', 'D2', 'D3']:
-            level_filter = f"Level = '{comparison_level}'"
-        else:
-            level_filter = "Level = 'D1'"  # Default to D1
-        
-        print(f"Querying FIXED college hitting averages for: {comparison_level} with filter: {level_filter}")
-        
-        # FIXED: Separate queries to avoid Cartesian product
+        # Only a handful of levels exist, so results are shared per level for a while
+        return shared_lookup(
+            ('college_averages', comparison_level),
+            lambda: fetch_college_hitting_averages(comparison_level),
+            ttl=COLLEGE_AVERAGES_CACHE_TTL
+        )
         
-        # 1. Get average exit velocity and other ball-level metrics
-        ball_metrics_query = f"""
+    except Exception as e:
+        logger.exception("Error getting FIXED college hitting averages for %s: %s", comparison_level, e)
+        return None
+
+COLLEGE_AVERAGES_CACHE_TTL = 3600  # seconds; the college table is refreshed rarely
+
+def fetch_college_hitting_averages(comparison_level):
+    """Query college hitting averages for one level (errors propagate; None when there's no data)"""
+    # Determine the WHERE clause based on comparison level
+    if comparison_level == 'SEC':
+        level_filter = "League = 'SEC'"
+    elif comparison_level in ['D1', 'D2', 'D3']:
+        level_filter = f"Level = '{comparison_level}'"
+    else:
+        level_filter = "Level = 'D1'"  # Default to D1
+    
+    logger.debug("Querying FIXED college hitting averages for: %s with filter: %s", comparison_level, level_filter)
+    
+    # FIXED: Separate queries to avoid Cartesian product
+    
+    # 1. Get average exit velocity and other ball-level metrics
+    ball_metrics_query = f"""
+    SELECT 
+        AVG(ExitSpeed) as avg_exit_velo,
+        APPROX_QUANTILES(ExitSpeed, 100)[OFFSET(90)] as percentile_90_exit_velo,
+        AVG(CASE 
+            WHEN ExitSpeed >= 95 AND Angle IS NOT NULL AND Angle >= 8 AND Angle <= 32 
+            THEN 1 ELSE 0 
+        END) * 100 as barrel_rate,
+        AVG(CASE 
+            WHEN ExitSpeed >= 95 
+            THEN 1 ELSE 0 
+        END) * 100 as hardhit_rate,
+        COUNT(*) as total_batted_balls
+    FROM `NCAABaseball.2025Final`
+    WHERE {level_filter}
+    AND ExitSpeed IS NOT NULL
+    AND ExitSpeed BETWEEN 60 AND 120  -- Same filtering as percentile function
+    """
+    
+    # 2. Get max exit velocity per batter, then average those (FIXED)
+    max_velo_query = f"""
+    SELECT 
+        AVG(max_exit_velo) as avg_max_exit_velo,
+        COUNT(*) as total_batters
+    FROM (
         SELECT 
-            AVG(ExitSpeed) as avg_exit_velo,
-            APPROX_QUANTILES(ExitSpeed, 100)[OFFSET(90)] as percentile_90_exit_velo,
-            AVG(CASE 
-                WHEN ExitSpeed >= 95 AND Angle IS NOT NULL AND Angle >= 8 AND Angle <= 32 
-                THEN 1 ELSE 0 
-            END) * 100 as barrel_rate,
-            AVG(CASE 
-                WHEN ExitSpeed >= 95 
-                THEN 1 ELSE 0 
-            END) * 100 as hardhit_rate,
-            COUNT(*) as total_batted_balls
+            Batter,
+            MAX(CASE WHEN ExitSpeed <= 120 AND ExitSpeed >= 60 THEN ExitSpeed ELSE NULL END) as max_exit_velo
         FROM `NCAABaseball.2025Final`
         WHERE {level_filter}
         AND ExitSpeed IS NOT NULL
-        AND ExitSpeed BETWEEN 60 AND 120  -- Same filtering as percentile function
-        """
-        
-        # 2. Get max exit velocity per batter, then average those (FIXED)
-        max_velo_query = f"""
-        SELECT 
-            AVG(max_exit_velo) as avg_max_exit_velo,
-            COUNT(*) as total_batters
-        FROM (
-            SELECT 
-                Batter,
-                MAX(CASE WHEN ExitSpeed <= 120 AND ExitSpeed >= 60 THEN ExitSpeed ELSE NULL END) as max_exit_velo
-            FROM `NCAABaseball.2025Final`
-            WHERE {level_filter}
-            AND ExitSpeed IS NOT NULL
-            AND ExitSpeed > 0
-            GROUP BY Batter
-            HAVING COUNT(*) >= 5  -- Same minimum as percentile function
-        )
-        WHERE max_exit_velo IS NOT NULL
-        """
-        
-        # Execute both queries separately
-        print(f"Executing ball metrics query...")
-        ball_result = client.query(ball_metrics_query)
-        ball_row = list(ball_result)[0] if ball_result else None
-        
-        print(f"Executing max velocity query...")
-        max_result = client.query(max_velo_query)
-        max_row = list(max_result)[0] if max_result else None
-        
-        print(f"Ball metrics result: {ball_row}")
-        print(f"Max velocity result: {max_row}")
-        
-        if ball_row and max_row and ball_row.total_batted_balls > 0:
-            college_data = {
-                'avg_exit_velo': float(ball_row.avg_exit_velo) if ball_row.avg_exit_velo else None,
-                'max_exit_velo': float(max_row.avg_max_exit_velo) if max_row.avg_max_exit_velo else None,  # FIXED - no more Cartesian product
-                'percentile_90_exit_velo': float(ball_row.percentile_90_exit_velo) if ball_row.percentile_90_exit_velo else None,
-                'barrel_rate': float(ball_row.barrel_rate) if ball_row.barrel_rate else None,
-                'hardhit_rate': float(ball_row.hardhit_rate) if ball_row.hardhit_rate else None,
-                'total_batted_balls': int(ball_row.total_batted_balls),
-                'total_batters': int(max_row.total_batters) if max_row.total_batters else None
-            }
-            print(f"Returning FIXED college data: {college_data}")
-            return college_data
-        else:
-            print(f"No data found for {comparison_level}")
-            return None
-        
-    except Exception as e:
-        print(f"Error getting FIXED college hitting averages for {comparison_level}: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        AND ExitSpeed > 0
+        GROUP BY Batter
+        HAVING COUNT(*) >= 5  -- Same minimum as percentile function
+    )
+    WHERE max_exit_velo IS NOT NULL
+    """
+    
+    # Execute both queries separately
+    logger.debug("Executing ball metrics query...")
+    ball_result = client.query(ball_metrics_query)
+    ball_row = list(ball_result)[0] if ball_result else None
+    
+    logger.debug("Executing max velocity query...")
+    max_result = client.query(max_velo_query)
+    max_row = list(max_result)[0] if max_result else None
+    
+    logger.debug("Ball metrics result: %s", ball_row)
+    logger.debug("Max velocity result: %s", max_row)
+    
+    if ball_row and max_row and ball_row.total_batted_balls > 0:
+        college_data = {
+            'avg_exit_velo': float(ball_row.avg_exit_velo) if ball_row.avg_exit_velo else None,
+            'max_exit_velo': float(max_row.avg_max_exit_velo) if max_row.avg_max_exit_velo else None,  # FIXED - no more Cartesian product
+            'percentile_90_exit_velo': float(ball_row.percentile_90_exit_velo) if ball_row.percentile_90_exit_velo else None,
+            'barrel_rate': float(ball_row.barrel_rate) if ball_row.barrel_rate else None,
+            'hardhit_rate': float(ball_row.hardhit_rate) if ball_row.hardhit_rate else None,
+            'total_batted_balls': int(ball_row.total_batted_balls),
+            'total_batters': int(max_row.total_batters) if max_row.total_batters else None
+        }
+        logger.debug("Returning FIXED college data: %s", college_data)
+        return college_data
+    else:
+        logger.warning("No data found for %s", comparison_level)
         return None
 
 def calculate_hitting_comparison(player_value, college_average):
@@ -565,15 +840,141 @@ def calculate_hitting_comparison(player_value, college_average):
         'absolute_diff': abs(difference)
     }
 
-def calculate_hitting_summary(hitting_data, hitter_name=None):
-    """Calculate hitting summary statistics with college comparisons"""
+# Tight numeric kernels, JIT-compiled when Numba is installed (cache=True keeps the compiled
+# code on disk so worker restarts don't recompile); otherwise equivalent NumPy expressions
+if njit is not None:
+    @njit(cache=True)
+    def count_hard_hits_and_barrels(exit_velocities, launch_angles):
+        """Count hard hits (95+ mph) and barrels (hard hit with launch angle 8-32 degrees)"""
+        hard_hits = 0
+        barrels = 0
+        for i in range(exit_velocities.size):
+            if exit_velocities[i] >= 95:
+                hard_hits += 1
+                if 8 <= launch_angles[i] <= 32:
+                    barrels += 1
+        return hard_hits, barrels
+    
+    @njit(cache=True)
+    def scale_side_view_points(y_values, z_values, y_min, y_max):
+        """Map contact depth/height (inches) to side view SVG x/y coordinates"""
+        n = z_values.size
+        svg_x = np.empty(n)
+        svg_y = np.empty(n)
+        y_range = y_max - y_min
+        for i in range(n):
+            svg_x[i] = 15 + (25 - z_values[i]) / 42 * 350
+            if y_range > 0:
+                y = 275 - ((y_values[i] - y_min) / y_range * 150)
+            else:
+                y = 200.0
+            svg_y[i] = max(110.0, min(285.0, y))
+        return svg_x, svg_y
+else:
+    def count_hard_hits_and_barrels(exit_velocities, launch_angles):
+        """Count hard hits (95+ mph) and barrels (hard hit with launch angle 8-32 degrees)"""
+        hard_hits = exit_velocities >= 95
+        barrels = hard_hits & (launch_angles >= 8) & (launch_angles <= 32)
+        return int(hard_hits.sum()), int(barrels.sum())
+    
+    def scale_side_view_points(y_values, z_values, y_min, y_max):
+        """Map contact depth/height (inches) to side view SVG x/y coordinates"""
+        svg_x = 15 + (25 - z_values) / 42 * 350
+        y_range = y_max - y_min
+        if y_range > 0:
+            svg_y = 275 - ((y_values - y_min) / y_range * 150)
+        else:
+            svg_y = np.full(y_values.shape, 200.0)
+        return svg_x, np.clip(svg_y, 110, 285)
+
+def calculate_exit_velo_metrics(hitting_data):
+    """Exit velocity metrics for batted balls with a recorded ExitSpeed, computed on NumPy columns"""
+    balls_with_ev = [h for h in hitting_data if h.get('ExitSpeed')]
+    
+    if not balls_with_ev:
+        return None
+    
+    count = len(balls_with_ev)
+    exit_velocities = np.fromiter((h['ExitSpeed'] for h in balls_with_ev), dtype=float, count=count)
+    launch_angles = np.fromiter(
+        (np.nan if h.get('Angle') is None else h['Angle'] for h in balls_with_ev),  # Missing angles become NaN
+        dtype=float, count=count
+    )
+    
+    # Hard Hit: 95+ mph; Barrel: 95+ mph AND launch angle between 8-32 degrees (NaN compares False)
+    hard_hits, barrels = count_hard_hits_and_barrels(exit_velocities, launch_angles)
+    
+    # 90th percentile, same index rule as before: sorted[int(0.9 * n)]. np.partition only places
+    # that one element (O(n) introselect) instead of sorting the whole array
+    percentile_index = int(0.9 * count)
+    percentile_90_ev = np.partition(exit_velocities, percentile_index)[percentile_index]
+    
+    return {
+        'avg_exit_velo': float(exit_velocities.mean()),
+        'max_exit_velo': float(exit_velocities.max()),
+        'percentile_90_ev': float(percentile_90_ev),
+        'barrel_rate': barrels / count * 100,
+        'hardhit_rate': hard_hits / count * 100,
+        'total_balls_with_ev': len(exit_velocities)
+    }
+
+def get_hitter_exit_velo_metrics(hitter_name, date):
+    """Exit velocity metrics for a hitter and date aggregated in BigQuery (same shape as calculate_exit_velo_metrics)"""
+    try:
+        # Same filter and 90th percentile index rule (sorted[int(0.9 * n)]) as the Python version
+        query = """
+        SELECT 
+            AVG(ExitSpeed) AS avg_exit_velo,
+            MAX(ExitSpeed) AS max_exit_velo,
+            ARRAY_AGG(ExitSpeed ORDER BY ExitSpeed)[SAFE_OFFSET(CAST(FLOOR(0.9 * COUNT(*)) AS INT64))] AS percentile_90_ev,
+            SAFE_DIVIDE(COUNTIF(ExitSpeed >= 95 AND Angle BETWEEN 8 AND 32), COUNT(*)) * 100 AS barrel_rate,
+            SAFE_DIVIDE(COUNTIF(ExitSpeed >= 95), COUNT(*)) * 100 AS hardhit_rate,
+            COUNT(*) AS total_balls_with_ev
+        FROM `V1PBR.TestTwo`
+        WHERE CAST(Date AS STRING) = @date
+        AND Batter = @hitter
+        AND ExitSpeed IS NOT NULL
+        AND ExitSpeed != 0
+        """
+        
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("date", "STRING", date),
+                bigquery.ScalarQueryParameter("hitter", "STRING", hitter_name),
+            ]
+        )
+        
+        rows = query_to_records(query, job_config=job_config)
+        if not rows or not rows[0]['total_balls_with_ev']:
+            return None
+        
+        row = rows[0]
+        return {
+            'avg_exit_velo': float(row['avg_exit_velo']),
+            'max_exit_velo': float(row['max_exit_velo']),
+            'percentile_90_ev': float(row['percentile_90_ev']),
+            'barrel_rate': float(row['barrel_rate']),
+            'hardhit_rate': float(row['hardhit_rate']),
+            'total_balls_with_ev': int(row['total_balls_with_ev'])
+        }
+        
+    except Exception as e:
+        logger.error("Error getting exit velocity metrics for %s: %s", hitter_name, e)
+        return None
+
+def calculate_hitting_summary(hitting_data, hitter_name=None, metrics=None):
+    """Calculate hitting summary statistics with college comparisons
+    
+    metrics may be passed in when they were already aggregated in BigQuery (see get_hitter_exit_velo_metrics).
+    """
     if not hitting_data:
         return None
     
-    # Filter to only balls with exit velocity
-    balls_with_ev = [h for h in hitting_data if h.get('ExitSpeed')]
+    # Exit velocity metrics over balls with exit velocity
+    if metrics is None:
+        metrics = calculate_exit_velo_metrics(hitting_data)
     
-    if not balls_with_ev:
+    if not metrics:
         return {
             'avg_exit_velo': 0,
             'percentile_90_ev': 0,
@@ -582,37 +983,11 @@ def calculate_hitting_summary(hitting_data, hitter_name=None):
             'hardhit_rate': 0
         }
     
-    exit_velocities = [h.get('ExitSpeed', 0) for h in balls_with_ev]
-    
-    # Calculate basic stats
-    avg_exit_velo = sum(exit_velocities) / len(exit_velocities)
-    max_exit_velo = max(exit_velocities)
-    
-    # Calculate 90th percentile
-    sorted_velocities = sorted(exit_velocities)
-    percentile_90_index = int(0.9 * len(sorted_velocities))
-    percentile_90_ev = sorted_velocities[percentile_90_index] if sorted_velocities else 0
-    
-    # Calculate Barrel Rate (95+ mph EV with launch angle 8-32 degrees)
-    barrels = 0
-    hard_hits = 0
-    
-    for hit in balls_with_ev:
-        exit_speed = hit.get('ExitSpeed', 0)
-        launch_angle = hit.get('Angle')
-        
-        # Hard Hit: 95+ mph
-        if exit_speed >= 95:
-            hard_hits += 1
-            
-            # Barrel: 95+ mph AND launch angle between 8-32 degrees
-            if launch_angle is not None and 8 <= launch_angle <= 32:
-                barrels += 1
-    
-    # Calculate percentages
-    total_balls_with_ev = len(balls_with_ev)
-    barrel_rate = (barrels / total_balls_with_ev * 100) if total_balls_with_ev > 0 else 0
-    hardhit_rate = (hard_hits / total_balls_with_ev * 100) if total_balls_with_ev > 0 else 0
+    avg_exit_velo = metrics['avg_exit_velo']
+    max_exit_velo = metrics['max_exit_velo']
+    percentile_90_ev = metrics['percentile_90_ev']
+    barrel_rate = metrics['barrel_rate']
+    hardhit_rate = metrics['hardhit_rate']
     
     # Get college comparison data
     comparison_level = None
@@ -671,7 +1046,18 @@ def get_hitter_summary():
     try:
         # Get hitter's detailed data
         query = """
-        SELECT *
+        SELECT 
+            PitchNo,
+            ExitSpeed,
+            Angle,
+            Distance,
+            Direction,
+            ContactPositionX,
+            ContactPositionY,
+            ContactPositionZ,
+            PlayResult,
+            Date,
+            Batter
         FROM `V1PBR.TestTwo`
         WHERE CAST(Date AS STRING) = @date
         AND Batter = @hitter
@@ -685,14 +1071,16 @@ def get_hitter_summary():
             ]
         )
         
-        result = client.query(query, job_config=job_config)
-        hitting_data = [dict(row) for row in result]
+        # Rows for the UI and the summary aggregates are fetched side by side
+        rows_future = query_executor.submit(query_to_records, query, job_config)
+        metrics_future = query_executor.submit(get_hitter_exit_velo_metrics, hitter_name, selected_date)
+        hitting_data = rows_future.result()
         
         if not hitting_data:
             return jsonify({'error': 'No hitting data found'}), 404
         
         # Calculate summary statistics WITH COMPARISONS
-        summary_stats = calculate_hitting_summary(hitting_data, hitter_name)
+        summary_stats = calculate_hitting_summary(hitting_data, hitter_name, metrics=metrics_future.result())
         
         return jsonify({
             'hitting_data': hitting_data,
@@ -702,92 +1090,75 @@ def get_hitter_summary():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# Color mapping - same colors regardless of zone
+CONTACT_COLOR_MAP = {
+    'ground-ball': '#34a853',
+    'line-drive': '#191970', 
+    'barrel': '#dc2626',
+    'fly-ball': '#4285f4',
+    'unknown': '#666666'
+}
+
+def get_contact_type(angle, exit_speed):
+    """Classify a contact point by launch angle (NaN means unknown) and exit speed"""
+    if np.isnan(angle):
+        return 'unknown'
+    if angle < 8:
+        return 'ground-ball'
+    elif 8 <= angle <= 32:
+        if exit_speed >= 95:
+            return 'barrel'
+        return 'line-drive'
+    else:
+        return 'fly-ball'
+
 def generate_contact_points_html(contact_data):
     """Generate HTML for contact points that will be injected into the template"""
     if not contact_data:
         return "", ""
     
-    # Filter for valid contact data
-    valid_contacts = []
-    for contact in contact_data:
-        y_pos = contact.get('ContactPositionY')  # Height (up/down) in inches
-        z_pos = contact.get('ContactPositionZ')  # Depth (front/back) in inches
-        if y_pos is not None and z_pos is not None:
-            valid_contacts.append(contact)
-    
-    if not valid_contacts:
-        return "", ""
-    
     # Extract Y and Z values and convert from feet to inches
-    y_values = [d['ContactPositionY'] * 12 for d in valid_contacts]  # Height values in inches
-    z_values = [d['ContactPositionZ'] * 12 for d in valid_contacts]  # Depth values in inches
+    y_values = contact_data['ContactPositionY'] * 12  # Height values in inches
+    z_values = contact_data['ContactPositionZ'] * 12  # Depth values in inches
+    x_values = contact_data['ContactPositionX'] * 12  # Side values in inches
+    exit_speeds = contact_data['ExitSpeed']
+    angles = contact_data['Angle']
+    distances = contact_data['Distance']
     
     # DEBUG: Print the actual Z values to see what we're working with
-    print(f"DEBUG: ContactPositionZ values (feet): {[d['ContactPositionZ'] for d in valid_contacts]}")
-    print(f"DEBUG: ContactPositionZ values (inches): {z_values}")
-    print(f"DEBUG: ContactPositionY values (inches): {y_values}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("DEBUG: ContactPositionZ values (feet): %s", contact_data['ContactPositionZ'].tolist())
+        logger.debug("DEBUG: ContactPositionZ values (inches): %s", z_values.tolist())
+        logger.debug("DEBUG: ContactPositionY values (inches): %s", y_values.tolist())
     
     # Use actual data range with some padding for Y (height)
-    y_min = min(y_values) - 3  # Add 3 inches padding below
-    y_max = max(y_values) + 3  # Add 3 inches padding above
-    
-    # Helper function to determine contact type
-    def get_contact_type(contact):
-        angle = contact.get('Angle')
-        if angle is None:
-            return 'unknown'
-        if angle < 8:
-            return 'ground-ball'
-        elif 8 <= angle <= 32:
-            exit_speed = contact.get('ExitSpeed', 0)
-            if exit_speed >= 95:
-                return 'barrel'
-            return 'line-drive'
-        else:
-            return 'fly-ball'
+    y_min = float(y_values.min()) - 3  # Add 3 inches padding below
+    y_max = float(y_values.max()) + 3  # Add 3 inches padding above
+    
+    # Map Z (depth) to SVG X using YOUR NUMBER LINE formula: x = 15 + (25 - z_value) / 42 * 350
+    # and Y (height) into the strike zone area (y=125 to y=275), middle if all Y values are the same.
+    # Y is clamped to reasonable bounds but X is not, so contact outside the zone still shows
+    svg_xs, svg_ys = scale_side_view_points(y_values, z_values, y_min, y_max)
     
     # Generate side view SVG elements using your number line coordinates
-    side_view_html = ""
+    side_parts = []
     
-    for i, contact in enumerate(valid_contacts):
-        y_pos = contact['ContactPositionY'] * 12  # Convert feet to inches
-        z_pos = contact['ContactPositionZ'] * 12  # Convert feet to inches
-        
-        # Map Z (depth) to SVG X coordinate using YOUR NUMBER LINE formula:
-        # x = 15 + (25 - z_value) / 42 * 350
-        svg_x = 15 + (25 - z_pos) / 42 * 350
+    for i in range(len(z_values)):
+        y_pos = y_values[i]
+        z_pos = z_values[i]
+        svg_x = svg_xs[i]
+        svg_y = svg_ys[i]
         
         # DEBUG: Print each calculation
-        print(f"DEBUG: Contact {i+1}: Z={z_pos:.1f}in -> SVG X={svg_x:.1f}")
-        
-        # Map Y (height) to SVG Y coordinate within the strike zone area
-        y_range_data = y_max - y_min
-        if y_range_data > 0:
-            y_normalized = (y_pos - y_min) / y_range_data
-            # Map to strike zone height area (y=125 to y=275)
-            svg_y = 275 - (y_normalized * 150)  # 150 is strike zone height
-        else:
-            svg_y = 200  # Middle if all Y values are the same
-        
-        # Clamp Y to reasonable bounds but allow X to extend beyond zone
-        svg_y = max(110, min(285, svg_y))
-        # Don't clamp svg_x - let it show contact outside the zone
+        logger.debug("DEBUG: Contact %d: Z=%.1fin -> SVG X=%.1f", i + 1, z_pos, svg_x)
         
         # Get contact type and styling
-        contact_type = get_contact_type(contact)
-        
-        # Color mapping - same colors regardless of zone
-        color_map = {
-            'ground-ball': '#34a853',
-            'line-drive': '#191970', 
-            'barrel': '#dc2626',
-            'fly-ball': '#4285f4',
-            'unknown': '#666666'
-        }
-        point_color = color_map.get(contact_type, '#666666')
+        exit_speed = exit_speeds[i]
+        contact_type = get_contact_type(angles[i], exit_speed)
+        
+        point_color = CONTACT_COLOR_MAP.get(contact_type, '#666666')
         
         # FIXED: Uniform size for all contact points
-        exit_speed = contact.get('ExitSpeed', 0)
         size = 5  # Uniform size for all points
         
         # Determine if contact is inside or outside the strike zone
@@ -799,65 +1170,57 @@ def generate_contact_points_html(contact_data):
         opacity = 0.85
         
         # Create tooltip
-        angle = contact.get('Angle', 'N/A')
-        distance = contact.get('Distance', 'N/A')
+        angle = angles[i]
+        distance = distances[i]
         zone_status = "IN ZONE" if is_in_zone else "OUT OF ZONE"
         
-        tooltip = f"Contact {i+1}: Z={z_pos:.1f}in (depth), Y={y_pos:.1f}in (height) | {zone_status} | EV: {exit_speed} mph | LA: {angle}° | Dist: {distance} ft"
+        # Missing values are NaN in the arrays; show them the way the record-based version did
+        ev_label = 0 if np.isnan(exit_speed) else exit_speed
+        angle_label = None if np.isnan(angle) else angle
+        
+        tooltip = f"Contact {i+1}: Z={z_pos:.1f}in (depth), Y={y_pos:.1f}in (height) | {zone_status} | EV: {ev_label} mph | LA: {angle_label}° | Dist: {distance} ft"
         
         # FIXED: Use squares for 95+ mph, circles for < 95 mph
         if exit_speed >= 95:
             # Generate SVG rectangle (square)
-            side_view_html += f'''
+            side_parts.append(f'''
                 <rect x="{svg_x - size}" y="{svg_y - size}" width="{size * 2}" height="{size * 2}" 
                       fill="{point_color}" stroke="rgba(255,255,255,0.8)" stroke-width="{stroke_width}" 
                       opacity="{opacity}" class="contact-point-uniform">
                     <title>{tooltip}</title>
                 </rect>
-            '''
+            ''')
         else:
             # Generate SVG circle
-            side_view_html += f'''
+            side_parts.append(f'''
                 <circle cx="{svg_x:.1f}" cy="{svg_y:.1f}" r="{size}" 
                         fill="{point_color}" stroke="rgba(255,255,255,0.8)" stroke-width="{stroke_width}" 
                         opacity="{opacity}" class="contact-point-uniform">
                     <title>{tooltip}</title>
                 </circle>
-            '''
+            ''')
     
-    # Keep original overhead view (unchanged)
-    overhead_view_html = ""
-    x_values = [d['ContactPositionX'] for d in contact_data if d['ContactPositionX'] is not None]
+    side_view_html = ''.join(side_parts)
     
-    if x_values:
-        for i, contact in enumerate(contact_data):
-            x_pos = contact.get('ContactPositionX')
-            z_pos = contact.get('ContactPositionZ')
-            
-            if x_pos is not None and z_pos is not None:
-                # Convert feet to inches
-                x_inches = x_pos * 12
-                z_inches = z_pos * 12
-                
-                # Map to percentage coordinates for overhead view
-                x_percent = ((x_inches + 18) / 36) * 80 + 10
-                z_percent = ((z_inches + 17) / 34) * 80 + 10
-                
-                # Clamp to visible area
-                x_percent = max(5, min(95, x_percent))
-                z_percent = max(5, min(95, z_percent))
-                
-                contact_type = get_contact_type(contact)
-                
-                y_inches = contact.get('ContactPositionY', 0) * 12  # Convert feet to inches
-                tooltip = f"Point {i+1}: X={x_inches:.1f}\" (side), Z={z_inches:.1f}\" (depth), Y={y_inches:.1f}\" (height)"
-                
-                overhead_view_html += f'''
-                <div class="contact-point {contact_type}" 
+    # Keep original overhead view (unchanged); map to percentage coordinates and clamp to the
+    # visible area for all points at once
+    x_percents = np.clip(((x_values + 18) / 36) * 80 + 10, 5, 95)
+    z_percents = np.clip(((z_values + 17) / 34) * 80 + 10, 5, 95)
+    
+    overhead_parts = [
+        f'''
+                <div class="contact-point {get_contact_type(angle, exit_speed)}" 
                      style="left: {x_percent:.1f}%; top: {z_percent:.1f}%;" 
-                     title="{tooltip}">
+                     title="Point {i+1}: X={x_inches:.1f}\" (side), Z={z_inches:.1f}\" (depth), Y={y_inches:.1f}\" (height)">
                     <span class="contact-number">{i+1}</span>
                 </div>'''
+        for i, (x_percent, z_percent, x_inches, z_inches, y_inches, angle, exit_speed) in enumerate(zip(
+            x_percents.tolist(), z_percents.tolist(), x_values.tolist(), z_values.tolist(),
+            y_values.tolist(), angles.tolist(), exit_speeds.tolist()
+        ))
+    ]
+    
+    overhead_view_html = ''.join(overhead_parts)
     
     return side_view_html, overhead_view_html
 
@@ -905,19 +1268,41 @@ def calculate_spray_chart_stats(hitting_data):
     }
 
 def get_spray_chart_data(hitter_name, date):
-    """Get spray chart specific data for a hitter and date"""
+    """Get spray chart specific data for a hitter and date, plus a BigQuery-computed summary row"""
     if not client:
-        return []
+        return [], None
     
     try:
         query = """
         SELECT 
-            PitchNo,
-            ExitSpeed,
-            Angle,
-            Distance,
-            Direction,
-            PlayResult
+            PitchNo,
+            ExitSpeed,
+            Angle,
+            Distance,
+            Direction,
+            PlayResult
+        FROM `V1PBR.TestTwo`
+        WHERE CAST(Date AS STRING) = @date
+        AND Batter = @hitter
+        AND ExitSpeed IS NOT NULL
+        AND Direction IS NOT NULL 
+        AND Distance IS NOT NULL
+        AND Distance > 0
+        ORDER BY PitchNo
+        """
+        
+        # Directional / ball-type aggregates over the same rows, computed server-side
+        summary_query = """
+        SELECT 
+            COUNTIF(Direction < -5) AS pull_cnt,
+            COUNTIF(Direction > 5) AS opp_cnt,
+            COUNTIF(Angle < 10) AS gb,
+            COUNTIF(Angle BETWEEN 10 AND 25) AS ld,
+            COUNTIF(Angle > 25) AS fb,
+            AVG(Distance) AS avg_d,
+            MAX(Distance) AS max_d,
+            COUNTIF(Distance >= 300) AS long_hits,
+            COUNT(*) AS n
         FROM `V1PBR.TestTwo`
         WHERE CAST(Date AS STRING) = @date
         AND Batter = @hitter
@@ -925,49 +1310,55 @@ def get_spray_chart_data(hitter_name, date):
         AND Direction IS NOT NULL 
         AND Distance IS NOT NULL
         AND Distance > 0
-        ORDER BY PitchNo
         """
         
         job_config = bigquery.QueryJobConfig(
             query_parameters=[
                 bigquery.ScalarQueryParameter("date", "STRING", date),
                 bigquery.ScalarQueryParameter("hitter", "STRING", hitter_name),
-            ]
+            ],
+            use_query_cache=True
         )
         
-        result = client.query(query, job_config=job_config)
-        spray_data = [dict(row) for row in result]
+        # Rows and the summary aggregates are fetched side by side
+        spray_future = query_executor.submit(query_to_records, query, job_config)
+        summary_future = query_executor.submit(query_to_records, summary_query, job_config)
+        spray_data = spray_future.result()
+        summary_rows = summary_future.result()
+        spray_summary = summary_rows[0] if summary_rows else None
         
-        print(f"Spray chart query returned {len(spray_data)} records for {hitter_name}")
-        return spray_data
+        logger.info("Spray chart query returned %s records for %s", len(spray_data), hitter_name)
+        return spray_data, spray_summary
         
     except Exception as e:
-        print(f"Error getting spray chart data: {str(e)}")
-        return []
+        logger.error("Error getting spray chart data: %s", e)
+        return [], None
+    
+
+def build_spray_radius_table():
+    """Precompute the spray chart radius (% of chart) for every whole foot from 0 to 500ft"""
+    d = np.arange(501.0)
     
+    # Based on your visual chart, map distances to radius percentages
+    # Looking at your image: 100ft ≈ 15%, 200ft ≈ 30%, 300ft ≈ 45%, 400ft ≈ 60%
+    return np.where(d <= 100, d * 0.15,                                  # 0-15% for 0-100ft
+           np.where(d <= 200, 15 + (d - 100) * 0.15,                     # 15-30% for 100-200ft
+           np.where(d <= 300, 30 + (d - 200) * 0.15,                     # 30-45% for 200-300ft
+           np.where(d <= 400, 45 + (d - 300) * 0.15,                     # 45-60% for 300-400ft
+                    60 + np.minimum((d - 400) / 100, 1) * 10))))         # 60-70% for 400ft+
+
+SPRAY_RADIUS_TABLE = build_spray_radius_table()
 
 def calculate_spray_position(direction, distance):
     """Calculate x,y position for spray chart based on direction and distance - CORRECTED"""
-    import math
-    
     # Normalize direction to field boundaries (-45° to +45°)
     field_direction = max(-45, min(45, direction))
     
     # Convert to radians
     angle_rad = math.radians(field_direction)
     
-    # Based on your visual chart, map distances to radius percentages
-    # Looking at your image: 100ft ≈ 15%, 200ft ≈ 30%, 300ft ≈ 45%, 400ft ≈ 60%
-    if distance <= 100:
-        radius_percent = (distance / 100) * 15  # 0-15% for 0-100ft
-    elif distance <= 200:
-        radius_percent = 15 + ((distance - 100) / 100) * 15  # 15-30% for 100-200ft
-    elif distance <= 300:
-        radius_percent = 30 + ((distance - 200) / 100) * 15  # 30-45% for 200-300ft
-    elif distance <= 400:
-        radius_percent = 45 + ((distance - 300) / 100) * 15  # 45-60% for 300-400ft
-    else:
-        radius_percent = 60 + min((distance - 400) / 100, 1) * 10  # 60-70% for 400ft+
+    # Radius lookup by whole feet (distances past 500ft share the 70% cap)
+    radius_percent = float(SPRAY_RADIUS_TABLE[min(max(int(distance), 0), 500)])
     
     # Convert to actual position
     # Home plate is at center-bottom: x=50%, y=85%
@@ -987,104 +1378,96 @@ def calculate_spray_position(direction, distance):
     y_percent = max(5, min(95, y_percent))
     
     # Debug output
-    print(f"Distance: {distance}ft, Direction: {direction}° -> Radius: {radius_percent:.1f}% -> Position: ({x_percent:.1f}%, {y_percent:.1f}%)")
+    logger.debug("Distance: %sft, Direction: %s° -> Radius: %.1f%% -> Position: (%.1f%%, %.1f%%)",
+                 distance, direction, radius_percent, x_percent, y_percent)
+    
+    return x_percent, y_percent
+
+def calculate_spray_positions(directions, distances):
+    """Vectorized calculate_spray_position for whole arrays of directions and distances"""
+    angle_rad = np.radians(np.clip(np.asarray(directions, dtype=float), -45, 45))
+    radius_index = np.clip(np.asarray(distances, dtype=float).astype(np.int64), 0, 500)
+    radius_percent = SPRAY_RADIUS_TABLE[radius_index]
+    
+    # Home plate is at center-bottom: x=50%, y=85%; y increases downward
+    x_percent = np.clip(50 + np.sin(angle_rad) * radius_percent, 5, 95)
+    y_percent = np.clip(85 - np.cos(angle_rad) * radius_percent, 5, 95)
     
     return x_percent, y_percent
 
-def generate_spray_chart_html(spray_chart_data):
+# Markup for one spray chart ball: color, left %, top %, ball number, distance, direction, launch angle
+SPRAY_BALL_TEMPLATE = (
+    '<div style="position:absolute;width:12px;height:12px;border-radius:50%%;'
+    'background:%s;left:%.1f%%;top:%.1f%%;z-index:5;border:1px solid rgba(255,255,255,0.7);'
+    'box-shadow:0 2px 4px rgba(0,0,0,0.3)" title="Ball %d: %sft, %s°, %s° LA"></div>'
+)
+
+def generate_spray_chart_html(spray_chart_data, spray_summary=None):
     """Generate HTML for spray chart balls with corrected positioning"""
     if not spray_chart_data:
         return "", {}
     
-    spray_balls_html = ""
+    spray_balls_parts = []
     
-    # Initialize counters
-    pull_count = 0
-    opposite_count = 0
-    ground_balls = 0
-    line_drives = 0
-    fly_balls = 0
-    total_distance = 0
-    valid_distance_count = 0
-    max_distance = 0
-    long_hits = 0
+    # Calculate every position on the spray chart in one vectorized pass
+    plotted = [(i, hit) for i, hit in enumerate(spray_chart_data)
+               if hit.get('Direction') is not None and hit.get('Distance') is not None and hit.get('Distance') > 0]
+    xs, ys = calculate_spray_positions([hit['Direction'] for _, hit in plotted],
+                                       [hit['Distance'] for _, hit in plotted])
     
-    for i, hit in enumerate(spray_chart_data):
+    for (i, hit), x, y in zip(plotted, xs, ys):
         direction = hit.get('Direction')
         distance = hit.get('Distance')
         angle = hit.get('Angle')
         
-        if (direction is not None and distance is not None and distance > 0):
-            # Calculate position on spray chart using fixed function
-            x, y = calculate_spray_position(direction, distance)
-            
-            # Determine ball type and color based on launch angle
-            ball_color = '#666'  # Default
-            ball_type = 'foul'
-            
-            if angle is not None:
-                if angle < 10:
-                    ball_type = 'ground-ball'
-                    ball_color = '#34a853'
-                    ground_balls += 1
-                elif 10 <= angle <= 25:
-                    ball_type = 'line-drive'
-                    ball_color = '#191970'
-                    line_drives += 1
-                else:
-                    ball_type = 'fly-ball'
-                    ball_color = '#4285f4'
-                    fly_balls += 1
-            
-            # Debug info for verification
-            print(f"Ball {i+1}: {distance}ft at {direction}° -> {x:.1f}%, {y:.1f}%")
-            
-            # Generate HTML for this ball
-            spray_balls_html += f'''
-            <div style="position: absolute; 
-                        width: 12px; 
-                        height: 12px; 
-                        border-radius: 50%; 
-                        background: {ball_color}; 
-                        left: {x:.1f}%; 
-                        top: {y:.1f}%; 
-                        z-index: 5; 
-                        border: 1px solid rgba(255,255,255,0.7); 
-                        box-shadow: 0 2px 4px rgba(0,0,0,0.3);" 
-                 title="Ball {i+1}: {distance}ft, {direction}°, {angle}° LA">
-            </div>'''
-            
-            # Update statistics
-            if direction < -5:
-                pull_count += 1
-            elif direction > 5:
-                opposite_count += 1
-            
-            total_distance += distance
-            valid_distance_count += 1
-            max_distance = max(max_distance, distance)
-            if distance >= 300:
-                long_hits += 1
-    
-    # Calculate percentages
-    total_directional = pull_count + opposite_count + (len(spray_chart_data) - pull_count - opposite_count)
-    pull_percentage = round((pull_count / total_directional) * 100) if total_directional > 0 else 0
-    opposite_percentage = round((opposite_count / total_directional) * 100) if total_directional > 0 else 0
-    avg_distance = round(total_distance / valid_distance_count) if valid_distance_count > 0 else 0
-    
-    # Return both HTML and statistics
-    spray_stats = {
-        'pull_percentage': pull_percentage,
-        'opposite_percentage': opposite_percentage,
-        'ground_balls': ground_balls,
-        'line_drives': line_drives,
-        'fly_balls': fly_balls,
-        'avg_distance': avg_distance,
-        'max_distance': max_distance,
-        'long_hits': long_hits
-    }
+        # Determine ball color based on launch angle
+        ball_color = '#666'  # Default
+        
+        if angle is not None:
+            if angle < 10:
+                ball_color = '#34a853'
+            elif 10 <= angle <= 25:
+                ball_color = '#191970'
+            else:
+                ball_color = '#4285f4'
+        
+        # Debug info for verification
+        logger.debug("Ball %d: %sft at %s° -> %.1f%%, %.1f%%", i + 1, distance, direction, x, y)
+        
+        # Generate HTML for this ball
+        spray_balls_parts.append(SPRAY_BALL_TEMPLATE % (ball_color, x, y, i + 1, distance, direction, angle))
+    
+    spray_balls_html = ''.join(spray_balls_parts)
+    
+    # Statistics come from the aggregate query in get_spray_chart_data
+    return spray_balls_html, build_spray_chart_stats(spray_summary)
+
+def build_spray_chart_stats(spray_summary):
+    """Map the BigQuery spray summary row onto the stats used by the report template"""
+    if not spray_summary or not spray_summary.get('n'):
+        return {
+            'pull_percentage': 0,
+            'opposite_percentage': 0,
+            'ground_balls': 0,
+            'line_drives': 0,
+            'fly_balls': 0,
+            'avg_distance': 0,
+            'max_distance': 0,
+            'long_hits': 0
+        }
+    
+    total = spray_summary['n']
     
-    return spray_balls_html, spray_stats
+    return {
+        'pull_percentage': round((spray_summary['pull_cnt'] / total) * 100),
+        'opposite_percentage': round((spray_summary['opp_cnt'] / total) * 100),
+        'ground_balls': spray_summary['gb'],
+        'line_drives': spray_summary['ld'],
+        'fly_balls': spray_summary['fb'],
+        'avg_distance': round(spray_summary['avg_d']) if spray_summary['avg_d'] is not None else 0,
+        'max_distance': spray_summary['max_d'] or 0,
+        'long_hits': spray_summary['long_hits']
+    }
 
 def debug_max_exit_velocity_data(comparison_level='D1'):
     """Debug function to see what's happening with max exit velocity data"""
@@ -1172,7 +1555,7 @@ def get_college_hitting_percentile_data(comparison_level='D1'):
         else:
             level_filter = "Level = 'D1'"  # Default to D1
         
-        print(f"Querying college hitting percentile data for: {comparison_level}")
+        logger.debug("Querying college hitting percentile data for: %s", comparison_level)
         
         # FIXED: Separate queries to match the averages function
         
@@ -1250,23 +1633,21 @@ def get_college_hitting_percentile_data(comparison_level='D1'):
                 data['max_exit_velo'].append(float(row.max_exit_velo))
         
         # Debug output
-        print(f"DEBUG: Percentile data collected for {comparison_level}:")
+        logger.debug("DEBUG: Percentile data collected for %s:", comparison_level)
         for key, values in data.items():
-            print(f"  {key}: {len(values)} values")
+            logger.debug("  %s: %s values", key, len(values))
             if values:
-                print(f"    Range: {min(values):.1f} - {max(values):.1f}")
-                print(f"    Average: {sum(values)/len(values):.1f}")
+                logger.debug("    Range: %.1f - %.1f", min(values), max(values))
+                logger.debug("    Average: %.1f", sum(values)/len(values))
         
         # Return data if we have any values
         has_data = any(len(values) > 0 for values in data.values())
-        print(f"DEBUG: Returning data: {has_data}")
+        logger.debug("DEBUG: Returning data: %s", has_data)
         
         return data if has_data else None
         
     except Exception as e:
-        print(f"ERROR getting college hitting percentile data for {comparison_level}: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("ERROR getting college hitting percentile data for %s: %s", comparison_level, e)
         return None
 
 def calculate_hitting_percentile_rank(player_value, college_data_list, metric_name=None):
@@ -1274,11 +1655,11 @@ def calculate_hitting_percentile_rank(player_value, college_data_list, metric_na
     if player_value is None or not college_data_list or len(college_data_list) == 0:
         return None
     
-    sorted_college_data = sorted(college_data_list)
-    total_count = len(sorted_college_data)
+    college_values = np.asarray(college_data_list, dtype=float)
+    total_count = len(college_values)
     
-    # Count how many college players this player performs better than
-    values_below = sum(1 for value in sorted_college_data if value < player_value)
+    # Count how many college players this player performs better than (no sort needed)
+    values_below = int(np.count_nonzero(college_values < player_value))
     
     # Calculate percentile - this should be the percentage of players below this performance
     raw_percentile = (values_below / total_count) * 100
@@ -1293,8 +1674,8 @@ def calculate_hitting_percentile_rank(player_value, college_data_list, metric_na
         final_percentile = 99.0
     
     # Debug output
-    print(f"DEBUG: Player value: {player_value}, College avg: {sum(sorted_college_data)/len(sorted_college_data):.1f}")
-    print(f"DEBUG: Values below player: {values_below}/{total_count} = {final_percentile}%")
+    logger.debug("DEBUG: Player value: %s, College avg: %.1f", player_value, college_values.mean())
+    logger.debug("DEBUG: Values below player: %d/%d = %s%%", values_below, total_count, final_percentile)
     
     return {
         'percentile': final_percentile,
@@ -1325,44 +1706,17 @@ def calculate_hitting_difference_from_average_with_percentile(player_value, coll
 def get_multi_level_hitting_comparisons(hitting_data, hitter_name=None):
     """Get percentile-based comparisons across D1, D2, D3 levels for hitting metrics"""
     try:
-        # Filter to only include batted balls with exit velocity
-        batted_balls = [hit for hit in hitting_data if hit.get('ExitSpeed')]
+        # Calculate player's hitting metrics over batted balls with exit velocity
+        metrics = calculate_exit_velo_metrics(hitting_data)
         
-        if not batted_balls:
+        if not metrics:
             return None
         
-        # Calculate player's hitting metrics
-        exit_velocities = [h.get('ExitSpeed', 0) for h in batted_balls]
-        
-        # Calculate basic stats
-        player_avg_exit_velo = sum(exit_velocities) / len(exit_velocities)
-        player_max_exit_velo = max(exit_velocities)
-        
-        # Calculate 90th percentile
-        sorted_velocities = sorted(exit_velocities)
-        percentile_90_index = int(0.9 * len(sorted_velocities))
-        player_percentile_90_ev = sorted_velocities[percentile_90_index] if sorted_velocities else 0
-        
-        # Calculate Barrel Rate and Hard Hit Rate
-        barrels = 0
-        hard_hits = 0
-        
-        for hit in batted_balls:
-            exit_speed = hit.get('ExitSpeed', 0)
-            launch_angle = hit.get('Angle')
-            
-            # Hard Hit: 95+ mph
-            if exit_speed >= 95:
-                hard_hits += 1
-                
-                # Barrel: 95+ mph AND launch angle between 8-32 degrees
-                if launch_angle is not None and 8 <= launch_angle <= 32:
-                    barrels += 1
-        
-        # Calculate percentages
-        total_balls_with_ev = len(batted_balls)
-        player_barrel_rate = (barrels / total_balls_with_ev * 100) if total_balls_with_ev > 0 else 0
-        player_hardhit_rate = (hard_hits / total_balls_with_ev * 100) if total_balls_with_ev > 0 else 0
+        player_avg_exit_velo = metrics['avg_exit_velo']
+        player_max_exit_velo = metrics['max_exit_velo']
+        player_percentile_90_ev = metrics['percentile_90_ev']
+        player_barrel_rate = metrics['barrel_rate']
+        player_hardhit_rate = metrics['hardhit_rate']
         
         # Get comparison level if hitter name provided
         hitter_comparison_level = 'D1'
@@ -1454,18 +1808,104 @@ def get_multi_level_hitting_comparisons(hitting_data, hitter_name=None):
         return hitting_comparison
 
     except Exception as e:
-        print(f"Error getting multi-level hitting comparisons: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error getting multi-level hitting comparisons: %s", e)
         return None
 
 
-def generate_hitter_pdf(hitter_name, hitting_data, date):
-    """Generate a PDF report for the hitter using WeasyPrint"""
+def json_serializer(o):
+    """JSON serializer for objects not serializable by default json code"""
+    if isinstance(o, (date_type, datetime)):
+        return o.isoformat()
+    elif isinstance(o, Decimal):
+        return float(o)
+    elif isinstance(o, np.ndarray):
+        return o.tolist()
+    elif isinstance(o, np.generic):
+        return o.item()
+    elif hasattr(o, '__dict__'):
+        return o.__dict__
+    else:
+        return str(o)
+
+# Custom filter to convert data to JSON for JavaScript - FIXED VERSION
+def tojsonfilter(obj):
+    if orjson:
+        # orjson handles date/datetime and NumPy natively; json_serializer covers Decimal and the rest.
+        # OPT_NON_STR_KEYS accepts int/date dict keys the way json.dumps does
+        return orjson.dumps(
+            obj, default=json_serializer, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode('utf-8')
+    return json.dumps(obj, default=json_serializer)
+
+# Jinja environment for the PDF report, created once per process. Compiled templates are
+# kept in the environment's cache and never re-read from disk (auto_reload=False).
+REPORT_ENV = Environment(loader=FileSystemLoader('.'), auto_reload=False)
+REPORT_ENV.filters['tojsonfilter'] = tojsonfilter
+REPORT_TEMPLATE_NAME = 'hitter_report.html'
+
+# The report's <head> stylesheet is static CSS (no Jinja tags), so it can be parsed once
+REPORT_HEAD_STYLE = re.compile(r'(<head>.*?)<style>(.*?)</style>', re.S)
+
+@functools.lru_cache(maxsize=1)
+def get_report_template():
+    """The compiled report template and its stylesheets, loaded once per process (a missing file is retried next call)
+    
+    The <head> <style> block is cut out of the template and parsed into a weasyprint.CSS here, then
+    passed to write_pdf, so WeasyPrint doesn't re-parse ~1000 lines of CSS for every report.
+    """
+    source, _, _ = REPORT_ENV.loader.get_source(REPORT_ENV, REPORT_TEMPLATE_NAME)
+    match = REPORT_HEAD_STYLE.search(source)
+    if not match:
+        return REPORT_ENV.get_template(REPORT_TEMPLATE_NAME), []
+    
+    stylesheets = [weasyprint.CSS(string=match.group(2), base_url=BASE_URL, url_fetcher=report_url_fetcher)]
+    source = source[:match.start()] + match.group(1) + source[match.end():]
+    return REPORT_ENV.from_string(source), stylesheets
+
+# WeasyPrint font setup is reused across renders; it isn't documented as thread-safe, so one per thread
+REPORT_RENDER_STATE = threading.local()
+
+def get_font_config():
+    """This thread's WeasyPrint FontConfiguration, created on first use"""
+    font_config = getattr(REPORT_RENDER_STATE, 'font_config', None)
+    if font_config is None:
+        font_config = FontConfiguration()
+        REPORT_RENDER_STATE.font_config = font_config
+    return font_config
+
+@functools.lru_cache(maxsize=64)
+def fetch_static_asset(url):
+    """Read a local report asset (e.g. static/pbr.png) once and keep it in memory"""
+    result = weasyprint.default_url_fetcher(url)
+    if 'file_obj' in result:
+        with result.pop('file_obj') as f:
+            result['string'] = f.read()
+    return result
+
+def report_url_fetcher(url, *args, **kwargs):
+    """URL fetcher for the report: files under BASE_URL come from memory, anything else as usual"""
+    if url.startswith(BASE_URL):
+        return dict(fetch_static_asset(url))
+    return weasyprint.default_url_fetcher(url, *args, **kwargs)
+
+# Compile the report template at import so the first PDF doesn't pay for it
+try:
+    get_report_template()
+except TemplateNotFound:
+    logger.warning("hitter_report.html not found. Make sure it's in the same directory as app.py")
+
+# Rendered PDFs keyed by (hitter, date, data hash); a changed row changes the hash,
+# so stale entries are never served and simply age out of the LRU
+PDF_CACHE = OrderedDict()
+PDF_CACHE_MAX_ENTRIES = 256  # Roughly a couple of full bulk sends; a report PDF is a few hundred KB
+PDF_CACHE_LOCK = threading.Lock()
+
+def build_hitter_report_context(hitter_name, hitting_data, date):
+    """Gather everything the report template needs (this is the part that talks to BigQuery)"""
     try:
         # Calculate summary stats
         if not hitting_data:
-            print(f"No hitting data for {hitter_name}")
+            logger.warning("No hitting data for %s", hitter_name)
             return None
             
         # Format hitter name (convert "Smith, Jack" to "Jack Smith")
@@ -1484,212 +1924,303 @@ def generate_hitter_pdf(hitter_name, hitting_data, date):
         # Generate multi-level comparisons
         multi_level_stats = get_multi_level_hitting_comparisons(hitting_data, hitter_name)
         
-        # Get point of contact data - filter for records with valid contact positions
-        contact_data = []
-        for hit in hitting_data:
-            # Check if contact position fields exist and are not None/null
-            x_pos = hit.get('ContactPositionX')
-            y_pos = hit.get('ContactPositionY') 
-            z_pos = hit.get('ContactPositionZ')
-            
-            # More flexible checking - also check for 0 values which might be valid
-            if (x_pos is not None and y_pos is not None and z_pos is not None and
-                x_pos != '' and y_pos != '' and z_pos != ''):
-                contact_data.append({
-                    'PitchNo': hit.get('PitchNo'),
-                    'ContactPositionX': float(x_pos) if x_pos is not None else None,
-                    'ContactPositionY': float(y_pos) if y_pos is not None else None,
-                    'ContactPositionZ': float(z_pos) if z_pos is not None else None,
-                    'ExitSpeed': hit.get('ExitSpeed'),
-                    'Angle': hit.get('Angle'),
-                    'Distance': hit.get('Distance'),
-                    'Direction': hit.get('Direction'),
-                    'PlayResult': hit.get('PlayResult')
-                })
+        # Get point of contact data - single pass over records with valid contact positions
+        contact_data = build_contact_arrays(hitting_data)
+        contact_count = len(contact_data['PitchNo']) if contact_data else 0
         
         # Calculate contact statistics
-        contact_stats = calculate_contact_stats(contact_data) if contact_data else None
+        contact_stats = calculate_contact_stats(contact_data)
         
         # Generate contact points HTML for server-side rendering
         side_view_points, overhead_view_points = generate_contact_points_html(contact_data)
 
         # Get spray chart specific data
-        spray_chart_data = get_spray_chart_data(hitter_name, date)
+        spray_chart_data, spray_summary = get_spray_chart_data(hitter_name, date)
 
         # NEW: Generate spray chart HTML and stats server-side
-        spray_balls_html, spray_chart_stats = generate_spray_chart_html(spray_chart_data)
+        spray_balls_html, spray_chart_stats = generate_spray_chart_html(spray_chart_data, spray_summary)
         
-        print(f"Generating PDF for {formatted_name} with {len(batted_balls)} batted balls and {len(contact_data)} contact points")
-        print(f"Generated {len(side_view_points.split('contact-point')) - 1} side view points")
-        print(f"Generated {len(overhead_view_points.split('contact-point')) - 1} overhead view points")
-        print(f"Generated {len(spray_balls_html.split('<div')) - 1} spray chart balls")
+        logger.info("Generating PDF for %s with %s batted balls and %s contact points", formatted_name, len(batted_balls), contact_count)
+        logger.info("Generated %s side view points", side_view_points.count('contact-point'))
+        logger.info("Generated %s overhead view points", overhead_view_points.count('contact-point'))
+        logger.info("Generated %s spray chart balls", spray_balls_html.count('<div'))
 
-        print(f"\n=== DEBUGGING HITTING DATA FOR {hitter_name} ===")
-        print(f"Total records: {len(hitting_data)}")
-        
-        if hitting_data:
-            # Check what fields are available
-            first_record = hitting_data[0]
-            print(f"Available fields: {list(first_record.keys())}")
+        # Field-by-field diagnostics; skipped entirely unless debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\n=== DEBUGGING HITTING DATA FOR %s ===", hitter_name)
+            logger.debug("Total records: %s", len(hitting_data))
             
-            # Check for spray chart specific fields
-            spray_fields = ['Direction', 'Distance', 'Angle', 'ExitSpeed']
-            for field in spray_fields:
-                if field in first_record:
-                    # Count non-null values
-                    non_null_count = len([h for h in hitting_data if h.get(field) is not None])
-                    print(f"{field}: {non_null_count}/{len(hitting_data)} non-null values")
-                    
-                    # Show sample values
-                    sample_values = [h.get(field) for h in hitting_data[:3] if h.get(field) is not None]
-                    print(f"  Sample values: {sample_values}")
-                else:
-                    print(f"{field}: FIELD NOT FOUND")
+            if hitting_data:
+                # Check what fields are available
+                first_record = hitting_data[0]
+                logger.debug("Available fields: %s", list(first_record.keys()))
+                
+                # Count non-null values for the spray chart fields and spray chart viability in one pass
+                spray_fields = ['Direction', 'Distance', 'Angle', 'ExitSpeed']
+                non_null_counts = dict.fromkeys(spray_fields, 0)
+                spray_viable_count = 0
+                for hit in hitting_data:
+                    for field in spray_fields:
+                        if hit.get(field) is not None:
+                            non_null_counts[field] += 1
+                    distance = hit.get('Distance')
+                    if hit.get('Direction') is not None and distance is not None and distance > 0:
+                        spray_viable_count += 1
+                
+                # Check for spray chart specific fields
+                for field in spray_fields:
+                    if field in first_record:
+                        logger.debug("%s: %s/%s non-null values", field, non_null_counts[field], len(hitting_data))
+                        
+                        # Show sample values
+                        sample_values = [h.get(field) for h in hitting_data[:3] if h.get(field) is not None]
+                        logger.debug("  Sample values: %s", sample_values)
+                    else:
+                        logger.debug("%s: FIELD NOT FOUND", field)
+                
+                # Check spray chart viability
+                logger.debug("Records viable for spray chart: %s/%s", spray_viable_count, len(hitting_data))
             
-            # Check spray chart viability
-            spray_viable = [hit for hit in hitting_data if 
-                           hit.get('Direction') is not None and 
-                           hit.get('Distance') is not None and 
-                           hit.get('Distance', 0) > 0]
-            print(f"Records viable for spray chart: {len(spray_viable)}/{len(hitting_data)}")
-        
-        print("=== END DEBUGGING ===\n")
-
-        # ADD NEW SPRAY CHART DEBUGGING
-        print(f"\n=== SPRAY CHART DEBUG ===")
-        print(f"spray_chart_data length: {len(spray_chart_data) if spray_chart_data else 0}")
-        if spray_chart_data:
-            print(f"First spray chart record: {spray_chart_data[0]}")
-            print(f"spray_chart_data sample fields: {list(spray_chart_data[0].keys()) if spray_chart_data else 'None'}")
+            logger.debug("=== END DEBUGGING ===\n")
+
+            # ADD NEW SPRAY CHART DEBUGGING
+            logger.debug("\n=== SPRAY CHART DEBUG ===")
+            logger.debug("spray_chart_data length: %s", len(spray_chart_data) if spray_chart_data else 0)
+            if spray_chart_data:
+                logger.debug("First spray chart record: %s", spray_chart_data[0])
+                logger.debug("spray_chart_data sample fields: %s", list(spray_chart_data[0].keys()) if spray_chart_data else 'None')
+                
+                # Check specific fields
+                for i, record in enumerate(spray_chart_data[:3]):
+                    direction = record.get('Direction')
+                    distance = record.get('Distance') 
+                    angle = record.get('Angle')
+                    logger.debug("Record %s: Direction=%s, Distance=%s, Angle=%s", i+1, direction, distance, angle)
+
+            logger.debug("hitting_data (all records) length: %s", len(hitting_data) if hitting_data else 0)
+            logger.debug("batted_balls length: %s", len(batted_balls) if batted_balls else 0)
+            if batted_balls:
+                logger.debug("First batted ball record keys: %s", list(batted_balls[0].keys()) if batted_balls else 'None')
+                # Check if batted_balls has spray chart fields
+                first_batted = batted_balls[0]
+                logger.debug("First batted ball Direction: %s", first_batted.get('Direction'))
+                logger.debug("First batted ball Distance: %s", first_batted.get('Distance'))
+                logger.debug("First batted ball Angle: %s", first_batted.get('Angle'))
             
-            # Check specific fields
-            for i, record in enumerate(spray_chart_data[:3]):
-                direction = record.get('Direction')
-                distance = record.get('Distance') 
-                angle = record.get('Angle')
-                print(f"Record {i+1}: Direction={direction}, Distance={distance}, Angle={angle}")
-
-        print(f"hitting_data (all records) length: {len(hitting_data) if hitting_data else 0}")
-        print(f"batted_balls length: {len(batted_balls) if batted_balls else 0}")
-        if batted_balls:
-            print(f"First batted ball record keys: {list(batted_balls[0].keys()) if batted_balls else 'None'}")
-            # Check if batted_balls has spray chart fields
-            first_batted = batted_balls[0]
-            print(f"First batted ball Direction: {first_batted.get('Direction')}")
-            print(f"First batted ball Distance: {first_batted.get('Distance')}")
-            print(f"First batted ball Angle: {first_batted.get('Angle')}")
-        
-        # Print spray chart stats
-        print(f"Generated spray chart stats: {spray_chart_stats}")
-        print("=== END SPRAY CHART DEBUG ===\n")
-        
-        # Read HTML template
+            # Print spray chart stats
+            logger.debug("Generated spray chart stats: %s", spray_chart_stats)
+            logger.debug("=== END SPRAY CHART DEBUG ===\n")
+        
+        return {
+            'hitter_name': formatted_name,
+            'date': date,
+            'summary_stats': summary_stats,
+            'hitting_data': batted_balls,  # Use batted balls for table (avoids null errors)
+            'spray_chart_data': spray_chart_data,  # Use spray_chart_data for spray chart
+            'contact_data': contact_data,
+            'contact_stats': contact_stats,
+            'spray_stats': spray_chart_stats,  # Use the pre-calculated spray stats
+            'spray_balls_html': spray_balls_html,  # Add the pre-generated spray chart HTML
+            'side_view_points_html': side_view_points,
+            'overhead_view_points_html': overhead_view_points,
+            'multi_level_stats': multi_level_stats  # Add the multi-level comparison data
+        }
+        
+    except Exception as e:
+        logger.exception("Error building report data for %s: %s", hitter_name, e)
+        return None
+
+def render_hitter_pdf(report_context):
+    """Render a report context to PDF bytes. Needs no BigQuery access, so it can run in a worker process"""
+    if not report_context:
+        return None
+    
+    formatted_name = report_context['hitter_name']
+    
+    try:
+        # Get the compiled HTML template
         try:
-            with open('hitter_report.html', 'r', encoding='utf-8') as file:
-                html_template = file.read()
-        except FileNotFoundError:
-            print("Error: hitter_report.html not found. Make sure it's in the same directory as app.py")
+            template, stylesheets = get_report_template()
+        except TemplateNotFound:
+            logger.error("Error: hitter_report.html not found. Make sure it's in the same directory as app.py")
             return None
         
-        # Custom filter to convert data to JSON for JavaScript - FIXED VERSION
-        def tojsonfilter(obj):
-            import json
-            from datetime import date, datetime
-            from decimal import Decimal
-            
-            def json_serializer(o):
-                """JSON serializer for objects not serializable by default json code"""
-                if isinstance(o, (date, datetime)):
-                    return o.isoformat()
-                elif isinstance(o, Decimal):
-                    return float(o)
-                elif hasattr(o, '__dict__'):
-                    return o.__dict__
-                else:
-                    return str(o)
-            
-            return json.dumps(obj, default=json_serializer)
-        
-        # Render template with data using Jinja2
-        from jinja2 import Environment
-        env = Environment()
-        env.filters['tojsonfilter'] = tojsonfilter
-        template = env.from_string(html_template)
-        
-        # UPDATED TEMPLATE RENDERING - Include spray chart HTML and stats
-        rendered_html = template.render(
-            hitter_name=formatted_name,
-            date=date,
-            summary_stats=summary_stats,
-            hitting_data=batted_balls,  # Use batted balls for table (avoids null errors)
-            spray_chart_data=spray_chart_data,  # Use spray_chart_data for spray chart
-            contact_data=contact_data,
-            contact_stats=contact_stats,
-            spray_stats=spray_chart_stats,  # Use the pre-calculated spray stats
-            spray_balls_html=spray_balls_html,  # Add the pre-generated spray chart HTML
-            side_view_points_html=side_view_points,
-            overhead_view_points_html=overhead_view_points,
-            multi_level_stats=multi_level_stats  # Add the multi-level comparison data
-        )
+        # UPDATED TEMPLATE RENDERING - Include spray chart HTML and stats.
+        # Streamed into one buffer instead of render()'s list of chunks plus the joined string
+        rendered_html = io.StringIO()
+        rendered_html.writelines(template.generate(**report_context))
+        rendered_html.seek(0)
         
         # Generate PDF using WeasyPrint with proper base_url for static files
         try:
-            # Get the absolute path to the current directory so WeasyPrint can find static files
-            base_url = f"file://{os.path.abspath('.')}/"
-            print(f"Using base_url: {base_url}")
-            
-            # Check if static files exist
-            static_dir = os.path.join(os.getcwd(), 'static')
-            if not os.path.exists(static_dir):
-                print(f"Warning: Static directory not found at {static_dir}")
-                os.makedirs(static_dir, exist_ok=True)
-                print(f"Created static directory at {static_dir}")
+            html_doc = weasyprint.HTML(file_obj=rendered_html, base_url=BASE_URL, url_fetcher=report_url_fetcher)
+            pdf_bytes = html_doc.write_pdf(
+                stylesheets=stylesheets, font_config=get_font_config(), optimize_images=True
+            )
             
-            html_doc = weasyprint.HTML(string=rendered_html, base_url=base_url)
-            pdf_bytes = html_doc.write_pdf()
-            print(f"PDF generated successfully for {formatted_name} with contact analysis and spray chart")
+            # WeasyPrint's document tree holds large Cairo/Pango allocations; release them now
+            del html_doc, rendered_html
+            gc.collect()
+            logger.info("PDF generated successfully for %s with contact analysis and spray chart", formatted_name)
             return pdf_bytes
         except Exception as e:
-            print(f"WeasyPrint error: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("WeasyPrint error: %s", e)
             return None
         
     except Exception as e:
-        print(f"Error generating PDF for {hitter_name}: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error generating PDF for %s: %s", formatted_name, e)
         return None
 
-def send_hitter_email(hitter_name, email, hitting_data, date):
-    """Send email to hitter with PDF attachment - IMPROVED with better error handling and timeouts"""
+def pdf_cache_key(hitter_name, date, hitting_data):
+    """Cache key for a rendered report: hitter, date and a content hash of the hitting data"""
+    if orjson:
+        payload = orjson.dumps(hitting_data, default=str, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(hitting_data, default=str, sort_keys=True).encode('utf-8')
+    return (hitter_name, date, hashlib.blake2b(payload, digest_size=16).digest())
+
+def get_cached_pdf(key):
+    """Return cached PDF bytes for key (marking them most recently used), or None"""
+    with PDF_CACHE_LOCK:
+        pdf_bytes = PDF_CACHE.get(key)
+        if pdf_bytes is not None:
+            PDF_CACHE.move_to_end(key)
+        return pdf_bytes
+
+def store_cached_pdf(key, pdf_bytes):
+    """Cache PDF bytes for key, evicting the least recently used entries past the cap"""
+    with PDF_CACHE_LOCK:
+        PDF_CACHE[key] = pdf_bytes
+        PDF_CACHE.move_to_end(key)
+        while len(PDF_CACHE) > PDF_CACHE_MAX_ENTRIES:
+            PDF_CACHE.popitem(last=False)
+
+def generate_hitter_pdf(hitter_name, hitting_data, date):
+    """Generate a PDF report for the hitter using WeasyPrint"""
+    cache_key = pdf_cache_key(hitter_name, date, hitting_data)
+    pdf_bytes = get_cached_pdf(cache_key)
+    if pdf_bytes is not None:
+        logger.debug("Using cached PDF for %s on %s", hitter_name, date)
+        return pdf_bytes
+    
+    pdf_bytes = render_hitter_pdf(build_hitter_report_context(hitter_name, hitting_data, date))
+    if pdf_bytes:
+        store_cached_pdf(cache_key, pdf_bytes)
+    return pdf_bytes
+
+# Gmail throttles long-lived sessions, so bulk sends reconnect after this many messages
+SMTP_MESSAGES_PER_CONNECTION = 100
+
+def get_smtp_configs():
+    """SMTP configurations to try in order, starting with the configured host/port"""
+    # IMPROVED: Try multiple SMTP configurations with proper timeouts
+    smtp_configs = [
+        # Gmail with TLS
+        {
+            'host': 'smtp.gmail.com',
+            'port': 587,
+            'use_tls': True,
+            'use_ssl': False,
+            'timeout': 30
+        },
+        # Gmail with SSL
+        {
+            'host': 'smtp.gmail.com', 
+            'port': 465,
+            'use_tls': False,
+            'use_ssl': True,
+            'timeout': 30
+        },
+        # Outlook/Hotmail
+        {
+            'host': 'smtp-mail.outlook.com',
+            'port': 587,
+            'use_tls': True,
+            'use_ssl': False,
+            'timeout': 30
+        }
+    ]
+    
+    # Use the configured host/port if available, otherwise try multiple configs
+    if EMAIL_HOST and EMAIL_PORT:
+        smtp_configs.insert(0, {
+            'host': EMAIL_HOST,
+            'port': EMAIL_PORT,
+            'use_tls': True,
+            'use_ssl': False,
+            'timeout': 30
+        })
+    
+    return smtp_configs
+
+def open_smtp_connection():
+    """Connect and log in to the first SMTP server that works; returns None if all of them fail"""
+    last_error = None
+    
+    for config in get_smtp_configs():
+        server = None
+        try:
+            logger.info("Attempting to connect to %s:%s", config['host'], config['port'])
+            
+            if config['use_ssl']:
+                # Use SMTP_SSL for SSL connections
+                server = smtplib.SMTP_SSL(
+                    config['host'], 
+                    config['port'], 
+                    timeout=config['timeout']
+                )
+            else:
+                # Use regular SMTP for TLS connections
+                server = smtplib.SMTP(
+                    config['host'], 
+                    config['port'], 
+                    timeout=config['timeout']
+                )
+                
+                if config['use_tls']:
+                    logger.debug("Starting TLS...")
+                    server.starttls()
+            
+            logger.debug("Logging in...")
+            server.login(EMAIL_USERNAME, EMAIL_PASSWORD)
+            return server
+            
+        except Exception as e:
+            last_error = e
+            logger.warning("Failed to connect via %s:%s - %s", config['host'], config['port'], e)
+            close_smtp_connection(server)
+            continue
+    
+    # If all configurations failed
+    logger.error("All SMTP configurations failed. Last error: %s", last_error)
+    return None
+
+def close_smtp_connection(server):
+    """Close an SMTP session, ignoring errors from an already dropped connection"""
+    if server is None:
+        return
     try:
-        # Check if email config is available
-        if not EMAIL_USERNAME or not EMAIL_PASSWORD:
-            print("Email configuration not available. Please check email_config.json")
-            return False
-        
-        # Generate PDF
-        pdf_data = generate_hitter_pdf(hitter_name, hitting_data, date)
-        if not pdf_data:
-            print(f"Failed to generate PDF for {hitter_name}")
-            return False
-        
-        # Format hitter name for display
-        if ', ' in hitter_name:
-            last_name, first_name = hitter_name.split(', ', 1)
-            display_name = f"{first_name} {last_name}"
-        else:
-            display_name = hitter_name
-        
-        # Calculate basic stats for email body
-        total_abs = len(hitting_data) if hitting_data else 0
-        summary = calculate_hitting_summary(hitting_data, hitter_name)
-        
-        # Create email content
-        subject = f"Your Hitting Performance Report - {date}"
-        
-        body = f"""Hi {display_name},
+        server.quit()
+    except:
+        pass
+
+def build_hitter_email(hitter_name, email, hitting_data, date, pdf_data):
+    """Build the report email for a hitter with their PDF attached"""
+    # Format hitter name for display
+    if ', ' in hitter_name:
+        last_name, first_name = hitter_name.split(', ', 1)
+        display_name = f"{first_name} {last_name}"
+    else:
+        display_name = hitter_name
+    
+    # Calculate basic stats for email body
+    total_abs = len(hitting_data) if hitting_data else 0
+    summary = calculate_hitting_summary(hitting_data, hitter_name)
+    
+    # Create email content
+    subject = f"Your Hitting Performance Report - {date}"
+    
+    body = f"""Hi {display_name},
 
 Your hitting performance report for {date} is attached as a PDF.
 
@@ -1706,124 +2237,164 @@ Keep up the great work!
 Best regards,
 Coaching Staff
 """
+    
+    # Create filename (use display name for filename)
+    safe_name = display_name.replace(" ", "_").replace(",", "")
+    filename = f"{safe_name}_Hitting_Report_{date}.pdf"
+    
+    # Create email message with the PDF attached
+    msg = EmailMessage()
+    msg['Subject'] = subject
+    msg['From'] = EMAIL_FROM
+    msg['To'] = email
+    msg.set_content(body)
+    msg.add_attachment(pdf_data, maintype='application', subtype='pdf', filename=filename)
+    
+    return msg
+
+def send_via(server, msg):
+    """Send msg over an open SMTP session, reconnecting once if the server dropped the connection
+    
+    Returns the session to keep using, which is a new one after a reconnect.
+    """
+    try:
+        server.send_message(msg)
+    except smtplib.SMTPServerDisconnected:
+        logger.warning("SMTP server disconnected, reconnecting...")
+        close_smtp_connection(server)
+        server = open_smtp_connection()
+        if server is None:
+            raise
+        try:
+            server.send_message(msg)
+        except Exception:
+            # The caller only holds the old session, so the new one has to be closed here
+            close_smtp_connection(server)
+            raise
+    return server
+
+def send_hitter_email(hitter_name, email, hitting_data, date, pdf_data=None):
+    """Send email to hitter with PDF attachment - IMPROVED with better error handling and timeouts
+    
+    pdf_data may be passed in when the PDF was already rendered. Bulk sends use
+    build_hitter_email and send_via directly with a shared SMTP session.
+    """
+    try:
+        # Check if email config is available
+        if not EMAIL_CONFIGURED:
+            logger.warning("Email configuration not available. Please check email_config.json")
+            return False
         
-        # Create email message
-        msg = MIMEMultipart()
-        msg['Subject'] = subject
-        msg['From'] = EMAIL_FROM
-        msg['To'] = email
-        
-        # Add body
-        msg.attach(MIMEText(body, 'plain'))
-        
-        # Add PDF attachment
-        pdf_attachment = MIMEBase('application', 'octet-stream')
-        pdf_attachment.set_payload(pdf_data)
-        encoders.encode_base64(pdf_attachment)
-        
-        # Create filename (use display name for filename)
-        safe_name = display_name.replace(" ", "_").replace(",", "")
-        filename = f"{safe_name}_Hitting_Report_{date}.pdf"
+        # Generate PDF
+        if pdf_data is None:
+            pdf_data = generate_hitter_pdf(hitter_name, hitting_data, date)
+        if not pdf_data:
+            logger.error("Failed to generate PDF for %s", hitter_name)
+            return False
         
-        pdf_attachment.add_header(
-            'Content-Disposition',
-            f'attachment; filename="{filename}"'
-        )
-        msg.attach(pdf_attachment)
-        
-        # IMPROVED: Try multiple SMTP configurations with proper timeouts
-        smtp_configs = [
-            # Gmail with TLS
-            {
-                'host': 'smtp.gmail.com',
-                'port': 587,
-                'use_tls': True,
-                'use_ssl': False,
-                'timeout': 30
-            },
-            # Gmail with SSL
-            {
-                'host': 'smtp.gmail.com', 
-                'port': 465,
-                'use_tls': False,
-                'use_ssl': True,
-                'timeout': 30
-            },
-            # Outlook/Hotmail
-            {
-                'host': 'smtp-mail.outlook.com',
-                'port': 587,
-                'use_tls': True,
-                'use_ssl': False,
-                'timeout': 30
-            }
-        ]
+        msg = build_hitter_email(hitter_name, email, hitting_data, date, pdf_data)
         
-        # Use the configured host/port if available, otherwise try multiple configs
-        if EMAIL_HOST and EMAIL_PORT:
-            smtp_configs.insert(0, {
-                'host': EMAIL_HOST,
-                'port': EMAIL_PORT,
-                'use_tls': True,
-                'use_ssl': False,
-                'timeout': 30
-            })
+        server = open_smtp_connection()
+        if server is None:
+            return False
         
-        last_error = None
+        try:
+            logger.debug("Sending message...")
+            server = send_via(server, msg)
+            
+            logger.info("Email with PDF sent successfully to %s at %s", hitter_name, email)
+            return True
         
-        for config in smtp_configs:
-            try:
-                print(f"Attempting to send email via {config['host']}:{config['port']}")
-                
-                if config['use_ssl']:
-                    # Use SMTP_SSL for SSL connections
-                    import smtplib
-                    server = smtplib.SMTP_SSL(
-                        config['host'], 
-                        config['port'], 
-                        timeout=config['timeout']
-                    )
-                else:
-                    # Use regular SMTP for TLS connections
-                    server = smtplib.SMTP(
-                        config['host'], 
-                        config['port'], 
-                        timeout=config['timeout']
-                    )
-                    
-                    if config['use_tls']:
-                        print("Starting TLS...")
-                        server.starttls()
-                
-                print("Logging in...")
-                server.login(EMAIL_USERNAME, EMAIL_PASSWORD)
-                
-                print("Sending message...")
-                server.send_message(msg)
-                server.quit()
-                
-                print(f"Email with PDF sent successfully to {display_name} at {email} via {config['host']}")
-                return True
-                
-            except Exception as e:
-                last_error = e
-                print(f"Failed to send via {config['host']}:{config['port']} - {str(e)}")
-                try:
-                    server.quit()
-                except:
-                    pass
-                continue
+        except Exception as e:
+            logger.error("Failed to send email to %s at %s - %s", hitter_name, email, e)
+            return False
         
-        # If all configurations failed
-        print(f"All SMTP configurations failed. Last error: {str(last_error)}")
-        return False
+        finally:
+            close_smtp_connection(server)
         
     except Exception as e:
-        print(f"Failed to send email to {hitter_name} at {email}: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Failed to send email to %s at %s: %s", hitter_name, email, e)
         return False
 
+# How many hitters have their report prepared at once during a bulk send
+BULK_PREPARE_WORKERS = 8
+
+# How long the bulk send waits for the next PDF before giving up on the ones still rendering
+BULK_RENDER_TIMEOUT = 120
+
+# Render workers are forked so they inherit the compiled template, stylesheet and prefetched data.
+# Under spawn/forkserver (the defaults on macOS and, from Python 3.14, Linux) every one-task worker
+# would re-import this module: a new BigQuery client, log listener and template compile per PDF.
+RENDER_POOL_CONTEXT = multiprocessing.get_context('fork')
+
+def init_render_worker():
+    """Pool initializer: restore default signal handling and log directly from the worker
+    
+    Workers forked from a gunicorn worker inherit its SIGTERM handler, which only flags the worker
+    to stop, so pool.terminate() couldn't kill a render hung in Cairo/Pango without this.
+    """
+    for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGQUIT):
+        signal.signal(signum, signal.SIG_DFL)
+    # Stop signals in the worker from writing into the parent's wakeup pipe
+    signal.set_wakeup_fd(-1)
+    configure_worker_logging()
+
+def prepare_bulk_recipient(row, hitting_data, selected_date):
+    """Build a prospect's report context (or find its cached PDF) for the bulk send"""
+    # Reports already rendered for identical data skip the context build and render
+    cache_key = pdf_cache_key(row['Prospect'], selected_date, hitting_data)
+    pdf_data = get_cached_pdf(cache_key)
+    report_context = None
+    if pdf_data is None:
+        report_context = build_hitter_report_context(row['Prospect'], hitting_data, selected_date)
+    
+    return {
+        'row': row,
+        'hitting_data': hitting_data,
+        'cache_key': cache_key,
+        'report_context': report_context,
+        'pdf_data': pdf_data
+    }
+
+def prepare_bulk_recipients(rows, hitting_data_by_batter, selected_date):
+    """Prepare every prospect for the bulk send concurrently; returns them in prospect order
+    
+    A prospect whose report can't be built is returned without a PDF, so it's reported as failed
+    instead of failing the whole batch.
+    """
+    with ThreadPoolExecutor(max_workers=BULK_PREPARE_WORKERS) as executor:
+        futures = [
+            executor.submit(prepare_bulk_recipient, row, hitting_data_by_batter.get(row['Prospect'], []), selected_date)
+            for row in rows
+        ]
+    
+    recipients = []
+    for row, future in zip(rows, futures):
+        try:
+            recipients.append(future.result())
+        except Exception:
+            logger.exception("Error preparing report for %s", row['Prospect'])
+            recipients.append({
+                'row': row,
+                'hitting_data': hitting_data_by_batter.get(row['Prospect'], []),
+                'cache_key': None,
+                'report_context': None,
+                'pdf_data': None
+            })
+    return recipients
+
+def finish_bulk_render(recipient, finished, pdf_data):
+    """Render pool callback: cache the new PDF and hand the recipient to the sender"""
+    recipient['pdf_data'] = pdf_data
+    if pdf_data:
+        store_cached_pdf(recipient['cache_key'], pdf_data)
+    finished.put(recipient)
+
+def fail_bulk_render(recipient, finished, error):
+    """Render pool error callback: log the failure and hand the recipient on without a PDF"""
+    logger.error("Error rendering PDF for %s", recipient['row']['Prospect'], exc_info=error)
+    finish_bulk_render(recipient, finished, None)
+
 @app.route('/api/send-emails', methods=['POST'])
 def send_emails():
     """API endpoint to send emails to hitters with their data"""
@@ -1837,13 +2408,22 @@ def send_emails():
         if not selected_date:
             return jsonify({'error': 'Date is required'}), 400
         
-        # Get hitters for the selected date
-        hitters_query = """
-        SELECT DISTINCT Batter
-        FROM `V1PBR.TestTwo`
-        WHERE CAST(Date AS STRING) = @date
-        AND Batter IS NOT NULL
-        ORDER BY Batter
+        # Hitting prospects from the Info table (Type = 'Hitting') who batted on the selected date
+        # and have an email, joined in BigQuery instead of intersecting two result sets here
+        prospects_query = """
+        SELECT p.Event, p.Prospect, p.Email, p.Type, p.Comp
+        FROM `V1PBRInfo.Info` p
+        JOIN (
+            SELECT DISTINCT Batter
+            FROM `V1PBR.TestTwo`
+            WHERE CAST(Date AS STRING) = @date
+            AND Batter IS NOT NULL
+        ) b
+        ON p.Prospect = b.Batter
+        WHERE p.Type = 'Hitting'
+        AND p.Email IS NOT NULL
+        AND p.Email != ''
+        ORDER BY p.Prospect
         """
         
         job_config = bigquery.QueryJobConfig(
@@ -1852,59 +2432,157 @@ def send_emails():
             ]
         )
         
-        hitters_result = client.query(hitters_query, job_config=job_config)
-        hitters_from_test = [row.Batter for row in hitters_result]
-        
-        # Get hitting prospects from Info table (Type = 'Hitting')
-        prospects_query = """
-        SELECT Event, Prospect, Email, Type, Comp
-        FROM `V1PBRInfo.Info`
-        WHERE Type = 'Hitting'
-        ORDER BY Prospect
-        """
-        
-        prospects_result = client.query(prospects_query)
+        # Rows decoded from Arrow as plain dicts (via the Storage Read API when available).
+        # Every eligible hitter's data is pre-fetched in this process so the PDF workers never need BigQuery
+        eligible = query_to_records(prospects_query, job_config=job_config)
         sent_emails = []
         failed_emails = []
         
-        for row in prospects_result:
-            if row.Prospect in hitters_from_test and row.Email:
-                # Get hitter's detailed data
-                hitter_data_query = """
-                SELECT *
-                FROM `V1PBR.TestTwo`
-                WHERE CAST(Date AS STRING) = @date
-                AND Batter = @hitter
-                ORDER BY PitchNo
-                """
-                
-                hitter_job_config = bigquery.QueryJobConfig(
-                    query_parameters=[
-                        bigquery.ScalarQueryParameter("date", "STRING", selected_date),
-                        bigquery.ScalarQueryParameter("hitter", "STRING", row.Prospect),
-                    ]
+        # Every eligible hitter's data in one query instead of one BigQuery job per hitter.
+        # Only the columns the report reads, plus Batter to group the rows by
+        hitter_data_query = """
+        SELECT 
+            PitchNo,
+            ExitSpeed,
+            Angle,
+            Distance,
+            Direction,
+            ContactPositionX,
+            ContactPositionY,
+            ContactPositionZ,
+            PlayResult,
+            Batter
+        FROM `V1PBR.TestTwo`
+        WHERE CAST(Date AS STRING) = @date
+        AND Batter IN UNNEST(@hitters)
+        ORDER BY Batter, PitchNo
+        """
+        
+        hitter_job_config = report_job_config([
+            bigquery.ScalarQueryParameter("date", "STRING", selected_date),
+            bigquery.ArrayQueryParameter("hitters", "STRING", sorted({row['Prospect'] for row in eligible})),
+        ])
+        
+        hitting_data_by_batter = {}
+        if eligible:
+            for record in query_to_records(hitter_data_query, job_config=hitter_job_config):
+                # prospects_query only returns hitters with rows for this date, so each one has data here
+                # Batter is dropped so the records match /api/send-individual-email's (same PDF cache key)
+                hitting_data_by_batter.setdefault(record.pop('Batter'), []).append(record)
+        
+        # Report builds are BigQuery round trips, so they overlap on threads; they all finish before
+        # the render pool is created, so rendering only overlaps with sending
+        recipients = prepare_bulk_recipients(eligible, hitting_data_by_batter, selected_date)
+        
+        # Render the remaining PDFs across cores (WeasyPrint is CPU-bound) while this thread emails
+        # each one as it finishes. Workers are forked, so they inherit the compiled template and never
+        # touch BigQuery; each exits after one PDF so WeasyPrint's memory growth is returned to the OS.
+        # Caveat: with maxtasksperchild=1 the pool forks a replacement after every PDF, from this
+        # threaded web worker, while this thread is in SMTP/TLS and other request threads may be in
+        # BigQuery calls or rendering a PDF in-process. A child forked while one of them holds a
+        # fontconfig, Pango or OpenSSL lock can deadlock; BULK_RENDER_TIMEOUT reports that hitter
+        # as failed and pool.terminate() kills the stuck worker.
+        finished = queue.Queue()
+        pending = []
+        for recipient in recipients:
+            if recipient['pdf_data'] is None and recipient['report_context']:
+                pending.append(recipient)
+            else:
+                finished.put(recipient)
+        
+        pool = None
+        if pending:
+            pool = RENDER_POOL_CONTEXT.Pool(
+                processes=min(len(pending), os.cpu_count() or 1),
+                maxtasksperchild=1,
+                initializer=init_render_worker
+            )
+            for recipient in pending:
+                pool.apply_async(
+                    render_hitter_pdf, (recipient['report_context'],),
+                    callback=functools.partial(finish_bulk_render, recipient, finished),
+                    error_callback=functools.partial(fail_bulk_render, recipient, finished)
                 )
+            pool.close()
+        
+        # One SMTP session for the whole batch instead of a TLS handshake + login per email
+        smtp_server = None
+        sent_on_connection = 0
+        remaining = {id(recipient): recipient for recipient in recipients}
+        try:
+            while remaining:
+                try:
+                    recipient = finished.get(timeout=BULK_RENDER_TIMEOUT)
+                except queue.Empty:
+                    # A worker killed mid-render (OOM, a crash in Cairo/Pango) never runs either callback
+                    logger.error(
+                        "No PDF finished within %d seconds; giving up on %d hitters",
+                        BULK_RENDER_TIMEOUT, len(remaining)
+                    )
+                    break
+                del remaining[id(recipient)]
                 
-                hitter_result = client.query(hitter_data_query, job_config=hitter_job_config)
-                hitting_data = [dict(r) for r in hitter_result]
+                row = recipient['row']
+                hitting_data = recipient['hitting_data']
+                pdf_data = recipient['pdf_data']
                 
-                # Try to send email
-                email_success = send_hitter_email(row.Prospect, row.Email, hitting_data, selected_date)
+                email_success = False
+                if pdf_data and EMAIL_CONFIGURED:
+                    if smtp_server is None or sent_on_connection >= SMTP_MESSAGES_PER_CONNECTION:
+                        close_smtp_connection(smtp_server)
+                        smtp_server = open_smtp_connection()
+                        sent_on_connection = 0
+                    
+                    # Try to send email over the shared session
+                    if smtp_server is not None:
+                        try:
+                            msg = build_hitter_email(row['Prospect'], row['Email'], hitting_data, selected_date, pdf_data)
+                            session = send_via(smtp_server, msg)
+                            if session is not smtp_server:
+                                # send_via reconnected; the per-connection cap counts from here
+                                smtp_server = session
+                                sent_on_connection = 0
+                            sent_on_connection += 1
+                            email_success = True
+                            logger.info("Email with PDF sent successfully to %s at %s", row['Prospect'], row['Email'])
+                        except smtplib.SMTPServerDisconnected as e:
+                            # Reconnect failed too; the next recipient will try a fresh session
+                            logger.error("Failed to send email to %s at %s - %s", row['Prospect'], row['Email'], e)
+                            smtp_server = None
+                        except Exception as e:
+                            logger.error("Failed to send email to %s at %s - %s", row['Prospect'], row['Email'], e)
                 
                 if email_success:
                     sent_emails.append({
-                        'hitter': row.Prospect,
-                        'email': row.Email,
-                        'type': row.Type,
-                        'event': row.Event,
+                        'hitter': row['Prospect'],
+                        'email': row['Email'],
+                        'type': row['Type'],
+                        'event': row['Event'],
                         'at_bats': len(hitting_data)
                     })
                 else:
                     failed_emails.append({
-                        'hitter': row.Prospect,
-                        'email': row.Email,
+                        'hitter': row['Prospect'],
+                        'email': row['Email'],
                         'error': 'Email sending failed'
                     })
+        finally:
+            close_smtp_connection(smtp_server)
+            if pool is not None:
+                # Also stops any worker still stuck on a render that will never finish
+                pool.terminate()
+                pool.join()
+        
+        for recipient in remaining.values():
+            failed_emails.append({
+                'hitter': recipient['row']['Prospect'],
+                'email': recipient['row']['Email'],
+                'error': 'PDF rendering timed out'
+            })
+        
+        # Recipients finish in render order; report them in prospect order
+        sent_emails.sort(key=lambda entry: entry['hitter'])
+        failed_emails.sort(key=lambda entry: entry['hitter'])
         
         return jsonify({
             'success': True,
@@ -1936,22 +2614,28 @@ def send_individual_email():
         
         # Get hitter's detailed data
         hitter_data_query = """
-        SELECT *
+        SELECT 
+            PitchNo,
+            ExitSpeed,
+            Angle,
+            Distance,
+            Direction,
+            ContactPositionX,
+            ContactPositionY,
+            ContactPositionZ,
+            PlayResult
         FROM `V1PBR.TestTwo`
         WHERE CAST(Date AS STRING) = @date
         AND Batter = @hitter
         ORDER BY PitchNo
         """
         
-        hitter_job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("date", "STRING", selected_date),
-                bigquery.ScalarQueryParameter("hitter", "STRING", hitter_name),
-            ]
-        )
+        hitter_job_config = report_job_config([
+            bigquery.ScalarQueryParameter("date", "STRING", selected_date),
+            bigquery.ScalarQueryParameter("hitter", "STRING", hitter_name),
+        ])
         
-        hitter_result = client.query(hitter_data_query, job_config=hitter_job_config)
-        hitting_data = [dict(row) for row in hitter_result]
+        hitting_data = query_to_records(hitter_data_query, job_config=hitter_job_config)
         
         if not hitting_data:
             return jsonify({'error': f'No hitting data found for {hitter_name} on {selected_date}'}), 400
@@ -1979,7 +2663,6 @@ def send_individual_email():
 
 if __name__ == '__main__':
     # Create templates directory if it doesn't exist
-    import os
     if not os.path.exists('templates'):
         os.makedirs('templates')
         print("Created templates directory")
@@ -1989,4 +2672,5 @@ if __name__ == '__main__':
     print("Make sure templates/hitting_index.html exists")
     print("Make sure hitter_report.html exists")
     print("Make sure static/pbr.png exists")
-    app.run(debug=True, host='0.0.0.0', port=5001)
\ No newline at end of file
+    print("For production, serve with threaded workers: gunicorn app:app (see gunicorn.conf.py)")
+    app.run(debug=True, host='0.0.0.0', port=5001, threaded=True)
\ No newline at end of file
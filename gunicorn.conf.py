@@ -0,0 +1,13 @@
+# Gunicorn settings for serving app:app in production: gunicorn app:app
+# Endpoints spend most of their time waiting on BigQuery, so each worker runs a
+# pool of threads and serves many requests at once instead of one per process.
+import multiprocessing
+
+bind = "0.0.0.0:5001"
+worker_class = "gthread"
+workers = min(2, multiprocessing.cpu_count())
+threads = 32
+# PDF rendering for the bulk email send can take a while
+timeout = 300
+# Not preloaded: the BigQuery client and thread pools in app.py are created per worker
+preload_app = False
@@ -0,0 +1,27 @@
+import os
+import signal
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+app = pytest.importorskip("app")
+
+
+def test_terminate_kills_a_hung_render_worker():
+    """pool.terminate() must not wait forever on a worker stuck mid-render"""
+    # Like gunicorn's worker handler: SIGTERM only sets a flag, and forked workers inherit it
+    previous = signal.signal(signal.SIGTERM, lambda signum, frame: None)
+    try:
+        pool = app.RENDER_POOL_CONTEXT.Pool(1, maxtasksperchild=1, initializer=app.init_render_worker)
+        pool.apply_async(time.sleep, (3600,))
+        time.sleep(0.5)  # let the worker pick up the task
+
+        terminator = threading.Thread(target=pool.terminate, daemon=True)
+        terminator.start()
+        terminator.join(timeout=10)
+        assert not terminator.is_alive()
+    finally:
+        signal.signal(signal.SIGTERM, previous)